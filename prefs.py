@@ -32,6 +32,48 @@ class MDHARD_Preferences(bpy.types.AddonPreferences):
         
     ) #type: ignore
 
+    dnt_backend: bpy.props.EnumProperty(
+        name="DNT Backend",
+        description="Modifier used for DNT normal transfer",
+        default='DATA_TRANSFER',
+        items=[
+            ('DATA_TRANSFER' , 'Data Transfer', 'Transfer normal with DATA_TRANSFER modifier'),
+            ('GEOMETRY_NODES', 'Geometry Nodes', 'Sample nearest source face normal with multithreaded geometry nodes (Blender 4.5+)'),
+        ]
+    ) #type: ignore
+
+    auto_cleanup_dnt_on_save: bpy.props.BoolProperty(
+        name="Auto Cleanup DNT On Save",
+        description="Remove DNT normal objects which are no longer used by any DNT modifier before saving",
+        default=False
+    ) #type: ignore
+
+    face_strength_backend: bpy.props.EnumProperty(
+        name="Face Strength Backend",
+        description="How face strength override is displayed",
+        default='NODE_INJECTION',
+        items=[
+            ('NODE_INJECTION', 'Node Injection', 'Add face strength nodes to every material'),
+            ('VIEW_LAYER', 'View Layer Override', 'Use face strength material as view layer material override. Materials are not touched'),
+        ]
+    ) #type: ignore
+
+    face_strength_visible_only: bpy.props.BoolProperty(
+        name="Face Strength Visible Only",
+        description="Node injection backend patches only materials of visible objects, and patches others when they become visible",
+        default=False
+    ) #type: ignore
+
+    part_isolation_mode: bpy.props.EnumProperty(
+        name="Part Isolation",
+        description="How other parts are isolated when part is activated in the part list",
+        default='HIDE',
+        items=[
+            ('HIDE', 'Hide', 'Hide other collections in viewport. They are still evaluated'),
+            ('EXCLUDE', 'Exclude', 'Exclude other part collections from view layer, so only active part is evaluated. Excluded parts are included again when activated'),
+        ]
+    ) #type: ignore
+
     md_home_dir: bpy.props.StringProperty(
         name="MD Hard Files Path",
         description="Store information of this addon.",
@@ -52,6 +94,13 @@ class MDHARD_Preferences(bpy.types.AddonPreferences):
         layout.label(text="DNT Default Settings", icon='MOD_BEVEL')
         layout.prop(self, 'default_bevel_width', text="Width")
         layout.prop(self, 'default_bevel_width_type', text="Type")
+        layout.prop(self, 'dnt_backend', text="Backend")
+        layout.prop(self, 'auto_cleanup_dnt_on_save', text="Cleanup Unused DNT On Save")
+        layout.prop(self, 'face_strength_backend', text="Face Strength")
+        row = layout.row()
+        row.enabled = self.face_strength_backend == 'NODE_INJECTION'
+        row.prop(self, 'face_strength_visible_only', text="Face Strength Visible Only")
+        layout.prop(self, 'part_isolation_mode', text="Part Isolation")
         layout.prop(self, 'md_home_dir', text="Addon Info Path", icon='FILE_FOLDER')
         layout.prop(self, 'max_nav_history', text="Max Navigation History")
         
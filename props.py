@@ -1,4 +1,5 @@
 import bpy
+from bpy.app.handlers import persistent
 from .setup_tools.register import register_prop, register_wrap, register_other
 from .tools import constants as ct
 from .tools import utils as ut
@@ -25,6 +26,14 @@ register_prop(
             )
         )
 
+register_prop(
+        bpy.types.ViewLayer,
+        ct.FACE_STRENGTH_PREV_MATERIAL_OVERRIDE, bpy.props.PointerProperty(
+            type=bpy.types.Material,
+            description="Material override before face strength view layer override. Restored when override is turned off",
+            )
+        )
+
 register_prop(
         bpy.types.Object,
         ct.IS_DNT_NORMAL_OBJECT, bpy.props.BoolProperty(
@@ -70,6 +79,17 @@ register_prop(
         ct.TEMP_VISIBILITY, bpy.props.BoolProperty(name=ct.TEMP_VISIBILITY, default = True, description="Store Visibility (eye icon in the outliner)")
         )
 
+@register_wrap
+class MDPartVisibilityPreset(bpy.types.PropertyGroup):
+    name:bpy.props.StringProperty(name='name', default='') #type: ignore
+    mask:bpy.props.IntProperty(name='mask', default=0, min=0, description="Visible reserved collections. Bit order follows reserved collection prefix") #type: ignore
+
+register_prop(
+        bpy.types.Collection,
+        ct.PART_VISIBILITY_PRESETS,
+        bpy.props.CollectionProperty(type=MDPartVisibilityPreset)
+        )
+
 register_prop(
         bpy.types.Collection,
         ct.IS_MD_HARDSURF_SUB_PART_COLLECTION, bpy.props.BoolProperty(
@@ -108,6 +128,25 @@ register_prop(
         )
 
 
+register_prop(
+        bpy.types.WindowManager,
+        ct.MD_LINK_PART_CANDIDATES_INDEX,
+        bpy.props.IntProperty(name=ct.MD_LINK_PART_CANDIDATES_INDEX, default=0)
+        )
+
+@register_wrap
+class MDLinkPartCandidate(bpy.types.PropertyGroup):
+    name:bpy.props.StringProperty(name='name', default='') #type: ignore
+    id_path:bpy.props.StringProperty(name='id_path', default='', description='The format is abs/path/to/*.blend|data_id|name') #type: ignore
+    select:bpy.props.BoolProperty(name='select', default=False) #type: ignore
+
+register_prop(
+        bpy.types.WindowManager,
+        ct.MD_LINK_PART_CANDIDATES,
+        bpy.props.CollectionProperty(type=MDLinkPartCandidate)
+        )
+
+
 # placeholder for rename data.
 for d_type in DataAttrNameDict.keys():
     register_prop(
@@ -196,27 +235,55 @@ register_prop(
 
 
 
-# def msgbus_callback(*arg):
-#     # in console will be print selected_objects 
-#     print(bpy.context.selected_objects)
-#     # you can do something
-        
-# def subscribe_to_obj(): 
-             
-#     bpy.msgbus.subscribe_rna(
-#         key=(bpy.types.LayerObjects, 'active'),
-#         owner=bpy,
-#         args=(),
-#         notify=msgbus_callback
-#         )
-    
-# def unsubscribe_to_obj():
-#     bpy.msgbus.clear_by_owner(bpy)
+#-------------------------------------------------------------------------------
+# Panel view model invalidation
+#-------------------------------------------------------------------------------
+PANEL_VIEW_MODEL_MSGBUS_KEYS = [
+    (bpy.types.Scene, ct.SCENE_COLLECTION_CHILD_INDEX),
+    (bpy.types.Scene, ct.ACTIVE_UILIST_COLLECTION),
+    (bpy.types.Scene, ct.ACTIVE_PART_COLLECTION),
+    (bpy.types.Collection, ct.TEMP_VISIBILITY),
+    (bpy.types.Collection, ct.IS_MD_HARDSURF_PART_COLLECTION),
+    (bpy.types.Collection, 'name'), # reserved collections are found by name prefix.
+]
+
+panel_view_model_msgbus_owner = object()
+
+
+def subscribe_panel_view_model():
+    for key in PANEL_VIEW_MODEL_MSGBUS_KEYS:
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=panel_view_model_msgbus_owner,
+            args=(),
+            notify=ut.invalidate_panel_caches
+            )
+
+def unsubscribe_panel_view_model():
+    bpy.msgbus.clear_by_owner(panel_view_model_msgbus_owner)
+
+
+@persistent
+def resubscribe_panel_view_model_on_load(dummy):
+    """msgbus subscriptions are cleared when file is loaded."""
+    ut.invalidate_panel_caches()
+    unsubscribe_panel_view_model()
+    subscribe_panel_view_model()
+
+
+def register_panel_view_model():
+    subscribe_panel_view_model()
+    bpy.app.handlers.load_post.append(resubscribe_panel_view_model_on_load)
+
+def unregister_panel_view_model():
+    if resubscribe_panel_view_model_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(resubscribe_panel_view_model_on_load)
+    unsubscribe_panel_view_model()
 
-# register_other(
-# subscribe_to_obj,
-# unsubscribe_to_obj
-# )
+register_other(
+    register_panel_view_model,
+    unregister_panel_view_model
+)
 
 # @register_wrap
 # class ShapeKeyInterfaceCollection(bpy.types.PropertyGroup):
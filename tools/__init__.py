@@ -4,6 +4,7 @@ if "bpy" not in locals():
     from . import utils
     from . import navigation
     from . import md_project
+    from . import profiler
     from . import operators
     from . import ui
 
@@ -13,5 +14,6 @@ else:
     importlib.reload(utils)
     importlib.reload(navigation)
     importlib.reload(md_project)
+    importlib.reload(profiler)
     importlib.reload(operators)
     importlib.reload(ui)
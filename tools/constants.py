@@ -15,6 +15,7 @@ ACTIVE_PART_COLLECTION = "active_part_collection" # read only property to keep t
 ACTIVE_UILIST_COLLECTION = "active_uilist_collection"
 
 TEMP_VISIBILITY = 'temp_visibility' # use for tracking visibility since there is no attribute.
+PART_VISIBILITY_PRESETS = 'part_visibility_presets' # visibility presets stored on part collection. mask bits follow PartManager.reserved_collection_prefix.
 
 # RESERVED_PART_COLLECTION_VISIBILITY = "reserved_part_collection_visibility"
 
@@ -24,6 +25,15 @@ DNT_NORMAL_TRANSFER_NAME = "DNT_NORMAL"
 DNT_BEVEL_NAME = "DNT_BEVEL"
 DNT_WEIGHTED_NORMAL_NAME = "DNT_WEIGHTED_NORMAL"
 MD_NORMAL_TRANSFER_NAME = "MD_NORMAL"
+MD_NORMAL_CONSOLIDATED_NAME = f"{MD_NORMAL_TRANSFER_NAME}_CONSOLIDATED" # single modifier replacing all MD_NORMAL-* modifiers.
+MD_NORMAL_CONSOLIDATED_NODE_GROUP_NAME = "__MD_Normal_Consolidated" # geometry nodes group of consolidated normal transfer.
+MD_NORMAL_SOURCE_ID_ATTR = "md_normal_source_id" # INT attribute. face: source index on merged source mesh, point: source index on target (-1 for none).
+MD_NORMAL_CONSOLIDATED_MOD_STATES = "md_normal_consolidated_mod_states" # object custom property, MD_NORMAL-* modifier name -> [show_viewport, show_render] before consolidation.
+
+# DNT backend
+DNT_NORMAL_NODE_GROUP_NAME = "__MD_DNT_Normal" # geometry nodes group used by 'GEOMETRY_NODES' DNT backend.
+DNT_NORMAL_NODE_GROUP_SOURCE_INPUT = "Source" # object input socket name of the DNT normal node group.
+DNT_BENCHMARK_MODIFIER_NAME = f"{DNT_NORMAL_TRANSFER_NAME}-BENCHMARK" # temporary modifier used in backend benchmark.
 
 
 # collection name prefix
@@ -32,6 +42,14 @@ NORMAL_COLLECTION = "NORMAL"
 DESIGN_COLLECTION = "D"
 FINAL_COLLECTION = "F"
 DEP_COLLECTION = "DEP" # other dependency file needed for final render.
+PART_PROXY_PREFIX = "PROXY" # lightweight stand-in of part, stored in source file as 'PROXY-F-xxx' collection.
+
+# part visibility presets available in every part. name -> visible reserved collection prefixes.
+BUILTIN_PART_VISIBILITY_PRESETS = {
+    "Final Only": [FINAL_COLLECTION],
+    "Final + DEP": [FINAL_COLLECTION, DEP_COLLECTION],
+    "Design + Normal": [DESIGN_COLLECTION, NORMAL_COLLECTION],
+}
 
 # blender file path
 FACE_STRENGTH_MATERIAL_BLEND_PATH = f"{BLEND_PATH}/face_strength_material.blend"
@@ -39,6 +57,7 @@ FACE_STRENGTH_MATERIAL_BLEND_PATH = f"{BLEND_PATH}/face_strength_material.blend"
 # face strength material override
 FACE_STRENGTH_MAT_NAME = f"__MD_FaceStrength" # Node tree name, material name, node name uses the same.
 FACE_STRENGTH_TEMP_OUTPUT_NODE = f"__MD_TempOutput" # material output node name.
+FACE_STRENGTH_PREV_MATERIAL_OVERRIDE = 'md_face_strength_prev_material_override' # view layer property, material override before face strength preview.
 
 
 # MD Project System Constants
@@ -53,6 +72,13 @@ MD_HARPOON_INDEX = 'md_harpoon_index'
 MD_HARPOON_UILIST_COLLECTION = 'md_harpoon_ui_list_collection'
 MD_HARPOON_INFO_JSON = 'md_harpoon_info.json' # store to project_root/.md_project/md_harpoon_info.json
 
+# Bulk link part
+MD_LINK_PART_CANDIDATES = 'md_link_part_candidates' # window manager collection property for bulk link dialog.
+MD_LINK_PART_CANDIDATES_INDEX = 'md_link_part_candidates_index'
+
+# DNT garbage collection
+MD_DNT_GC_REPORT_JSON = 'md_dnt_gc_report.json' # store to project_root/.md_project/md_dnt_gc_report.json
+
 
 # MD data placeholder prefix
 MD_PREFIX = 'MD'
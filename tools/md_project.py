@@ -11,6 +11,9 @@ from ..myblendrc_utils import utils as myu
 from . import constants as ct
 from ..prefs import get_preferences
 import json
+import csv
+import math
+from mathutils import Vector
 from ..setup_tools.register import register_other
 from .navigation import Navigation
 from ..myblendrc_utils.common_constants import DataAttrNameDict, DataS
@@ -420,59 +423,175 @@ def search_file_in_project_callback(self, context):
 
 
 # Parts Link
-def search_parts_in_project_callback(self, context):
-    """Callback function for search parts in project.
+def find_parts_in_project()->List[tuple]:
+    """Find 'F-' collections in project .blend files.
+    Returns:
+        list of (id_path, display_name). id_path format is 'abs/path/to/*.blend|collections|name'.
     """
     cwd = get_cwd()
-    enum_list = []
+    parts = []
     id_path_list, disp_path_list = myu.gen_blend_file_path_and_display_name_list(search_path=cwd, exclude_prefix='.')
 
-
     for path, disp_name in zip( id_path_list, disp_path_list):
         # load from current file will cause error so branch operation.
         if Path(path) == Path(bpy.data.filepath):
             collection_name_list = [c.name for c in bpy.data.collections[:] if c.name.startswith("F-")]
-
-            for c_name in collection_name_list:
-                enum_list.append((
-                    f"{path}|collections|{c_name}", 
-                    f"{disp_name}:{c_name}",
-                    ''))
         else:
             with bpy.data.libraries.load(path, link=True)  as (data_from, data_to):
                 collection_name_list = [name for name in data_from.collections if name.startswith("F-")]
 
-            for c_name in collection_name_list:
-                enum_list.append((
-                    f"{path}|collections|{c_name}", 
-                    f"{disp_name}:{c_name}",
-                    ''))
+        for c_name in collection_name_list:
+            parts.append((f"{path}|collections|{c_name}", f"{disp_name}:{c_name}"))
 
-    return enum_list
+    return parts
 
 
-def link_part(id_path:str):
-    """Link collection 'id_path' retrieved from search_parts_in_project_callback()
+def search_parts_in_project_callback(self, context):
+    """Callback function for search parts in project.
     """
-    filepath, data_id, name = parse_link_id_path(id_path)
-    col_to_link = None
+    return [(id_path, disp_name, '') for id_path, disp_name in find_parts_in_project()]
 
-    if Path(bpy.path.abspath(filepath)) == Path(bpy.path.abspath(bpy.data.filepath)):
-        col_to_link = bpy.data.collections.get(name)
-    else:
-        col_to_link = myu.load_from_lib_and_return(filepath=filepath, attr_name=data_id, name=name, link=True, relative=True)
-    
-    if col_to_link is not None:
-        new_part_obj = bpy.data.objects.new(name=col_to_link.name, object_data=None)
-        bpy.context.collection.objects.link(new_part_obj)
-        new_part_obj.instance_collection = col_to_link
+
+def update_link_part_candidates(wm:bpy.types.WindowManager):
+    """Fill bulk link dialog list with parts in project. Selection of parts still found is kept."""
+    candidates:bpy.types.CollectionProperty = getattr(wm, ct.MD_LINK_PART_CANDIDATES)
+    selected_id_paths = {c.id_path for c in candidates if c.select}
+
+    candidates.clear()
+    for id_path, disp_name in find_parts_in_project():
+        c = candidates.add()
+        c.name = disp_name
+        c.id_path = id_path
+        c.select = id_path in selected_id_paths
+    setattr(wm, ct.MD_LINK_PART_CANDIDATES_INDEX, 0)
+    return
+
+
+def resolve_part_collection_name(name:str, available_names:set, use_proxy:bool=False)->str:
+    """Name of collection to load for part. Proxy is used only when requested and generated in source file."""
+    proxy_name = ut.get_part_proxy_name(name)
+    if use_proxy and proxy_name in available_names:
+        return proxy_name
+    return name if name in available_names else None
+
+
+def load_part_collections(id_paths:List[str], use_proxy:bool=False)->List[tuple]:
+    """Link collections of given id_paths. Collections are grouped by source file,
+    so each file is loaded only once.
+    Returns:
+        list of (id_path, collection). id_path which failed to load is skipped.
+    """
+    entries_by_filepath = {}
+    for id_path in id_paths:
+        filepath, data_id, name = parse_link_id_path(id_path)
+        entries_by_filepath.setdefault(filepath, []).append((id_path, name))
+
+    loaded_pairs = []
+    for filepath, entries in entries_by_filepath.items():
+        if Path(bpy.path.abspath(filepath)) == Path(bpy.path.abspath(bpy.data.filepath)):
+            available_names = {c.name for c in bpy.data.collections if c.library is None}
+            requested = {name: resolve_part_collection_name(name, available_names, use_proxy) for _, name in entries}
+            loaded = {r: bpy.data.collections.get(r) for r in requested.values() if r is not None}
+        elif not Path(bpy.path.abspath(filepath)).exists():
+            print(f"File not found: '{filepath}'")
+            continue
+        else:
+            with bpy.data.libraries.load(filepath, link=True, relative=True) as (data_from, data_to):
+                available_names = set(data_from.collections)
+                requested = {name: resolve_part_collection_name(name, available_names, use_proxy) for _, name in entries}
+                names_to_load = list({r for r in requested.values() if r is not None})
+                data_to.collections = names_to_load
+            loaded = dict(zip(names_to_load, data_to.collections))
+
+        for id_path, name in entries:
+            col = loaded.get(requested[name])
+            if col is not None:
+                loaded_pairs.append((id_path, col))
+
+    return loaded_pairs
+
+
+def create_part_instance_empties(cols:List[bpy.types.Collection], target_collection:bpy.types.Collection,
+                                 locations:List[tuple]=None, rotations:List[tuple]=None, scales:List[tuple]=None)->List[bpy.types.Object]:
+    """Create collection instance empty for each collection and link them to target collection.
+    Empty of proxy is named after its part. Transforms are written before linking, so only new empties are touched.
+    """
+    new_part_objs = []
+    for i, col in enumerate(cols):
+        new_part_obj = bpy.data.objects.new(name=ut.get_part_name_of_proxy(col.name), object_data=None)
+        new_part_obj.instance_collection = col
         new_part_obj.empty_display_size  = 0.01
         new_part_obj.instance_type = 'COLLECTION'
+        if locations is not None:
+            new_part_obj.location = locations[i]
+        if rotations is not None:
+            new_part_obj.rotation_euler = rotations[i]
+        if scales is not None:
+            new_part_obj.scale = scales[i]
+        new_part_objs.append(new_part_obj)
 
-        myu.select_only(new_part_obj)
+    for new_part_obj in new_part_objs:
+        target_collection.objects.link(new_part_obj)
+    return new_part_objs
+
+
+def link_parts(id_paths:List[str], target_collection:bpy.types.Collection=None, use_proxy:bool=False)->List[bpy.types.Object]:
+    """Link collections 'id_paths' retrieved from find_parts_in_project() and instance them.
+    Args:
+        use_proxy: link 'PROXY-' collection instead of part if it is generated in source file.
+    Returns:
+        created instance empties.
+    """
+    if target_collection is None:
+        target_collection = bpy.context.collection
+
+    loaded_pairs = load_part_collections(id_paths, use_proxy=use_proxy)
+    return create_part_instance_empties([col for _, col in loaded_pairs], target_collection)
+
+
+def link_part(id_path:str, use_proxy:bool=False):
+    """Link collection 'id_path' retrieved from search_parts_in_project_callback()
+    """
+    new_part_objs = link_parts([id_path], use_proxy=use_proxy)
+    if len(new_part_objs) > 0:
+        myu.select_only(new_part_objs[0])
         # bpy.context.collection.children.link(col_to_link)
 
     return
+
+
+def swap_part_proxies(objs:List[bpy.types.Object], to_proxy:bool=None)->int:
+    """Swap instance collection of part instance empties between part and its proxy.
+    Args:
+        to_proxy: True to proxy, False to part, None to toggle each object.
+    Returns:
+        number of swapped objects.
+    """
+    targets_by_mode = {True: [], False: []}
+    for obj in objs:
+        col = obj.instance_collection
+        if obj.instance_type != 'COLLECTION' or col is None:
+            continue
+        is_proxy = ut.is_part_proxy_name(col.name)
+        want_proxy = (not is_proxy) if to_proxy is None else to_proxy
+        if want_proxy == is_proxy:
+            continue
+        filepath = col.library.filepath if col.library is not None else bpy.data.filepath
+        id_path = f"{bpy.path.abspath(filepath)}|collections|{ut.get_part_name_of_proxy(col.name)}"
+        targets_by_mode[want_proxy].append((obj, id_path))
+
+    swapped_count = 0
+    for use_proxy, targets in targets_by_mode.items():
+        if len(targets) == 0:
+            continue
+        loaded = dict(load_part_collections([id_path for _, id_path in targets], use_proxy=use_proxy))
+        for obj, id_path in targets:
+            col = loaded.get(id_path)
+            if col is None or ut.is_part_proxy_name(col.name) != use_proxy: # proxy not generated in source file.
+                continue
+            obj.instance_collection = col
+            swapped_count += 1
+    return swapped_count
     
 
 
@@ -486,6 +605,131 @@ def parse_link_id_path(id_path:str):
 
 
 
+#-------------------------------------------------------------------------------
+# Part Placement
+#-------------------------------------------------------------------------------
+def compute_grid_locations(count:int, columns:int, spacing:float, origin:Vector)->List[tuple]:
+    """Lay out 'count' locations on XY grid starting from origin, row by row."""
+    columns = max(columns, 1)
+    return [(origin.x + (i % columns) * spacing, origin.y + (i // columns) * spacing, origin.z) for i in range(count)]
+
+
+def compute_curve_transforms(curve_obj:bpy.types.Object, count:int):
+    """Distribute 'count' points along evaluated curve by arc length. Rotation follows curve tangent.
+    Evaluated curve must be a single polyline (one spline, no bevel, extrude or modifier generating faces).
+    Returns:
+        (locations, rotations) or 1 if curve is not a single polyline or has no length.
+    """
+    splines = curve_obj.data.splines
+    if len(splines) != 1:
+        print(f"Curve '{curve_obj.name}' is not a single spline.")
+        return 1
+    is_cyclic = splines[0].use_cyclic_u
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = curve_obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        points = [curve_obj.matrix_world @ v.co for v in mesh.vertices]
+        face_count = len(mesh.polygons)
+    finally:
+        eval_obj.to_mesh_clear()
+
+    if face_count != 0: # bevel or extrude
+        print(f"Curve '{curve_obj.name}' has bevel or extrude.")
+        return 1
+    if len(points) < 2:
+        print(f"Curve '{curve_obj.name}' has no length.")
+        return 1
+    if is_cyclic: # close the loop.
+        points.append(points[0])
+
+    cumulative = [0.0]
+    for p0, p1 in zip(points[:-1], points[1:]):
+        cumulative.append(cumulative[-1] + (p1 - p0).length)
+    total = cumulative[-1]
+    if total == 0.0:
+        print(f"Curve '{curve_obj.name}' has no length.")
+        return 1
+
+    locations = []
+    rotations = []
+    seg = 0
+    for i in range(count):
+        dist = total * i / (count - 1) if count > 1 else 0.0
+        while seg < len(points) - 2 and cumulative[seg + 1] < dist:
+            seg += 1
+        seg_length = cumulative[seg + 1] - cumulative[seg]
+        t = (dist - cumulative[seg]) / seg_length if seg_length > 0.0 else 0.0
+        p0, p1 = points[seg], points[seg + 1]
+        locations.append(tuple(p0.lerp(p1, t)))
+        rotations.append(tuple((p1 - p0).to_track_quat('Y', 'Z').to_euler()))
+
+    return locations, rotations
+
+
+def read_transforms_csv(filepath:str):
+    """Read transforms from CSV. Each row is 'x,y,z[,rx,ry,rz[,sx,sy,sz]]', rotation in degrees.
+    Rows which don't start with number (e.g. header) are skipped.
+    Returns:
+        (locations, rotations, scales) or 1 if file is not found or has no row.
+    """
+    filepath_p = Path(bpy.path.abspath(filepath))
+    if not filepath_p.exists():
+        print(f"File not found: '{filepath_p}'")
+        return 1
+
+    locations, rotations, scales = [], [], []
+    with open(str(filepath_p), newline='') as f:
+        for row in csv.reader(f):
+            try:
+                values = [float(v) for v in row if v.strip() != '']
+            except ValueError:
+                continue
+            if len(values) < 3:
+                continue
+            locations.append(tuple(values[0:3]))
+            rotations.append(tuple(math.radians(v) for v in values[3:6]) if len(values) >= 6 else (0.0, 0.0, 0.0))
+            scales.append(tuple(values[6:9]) if len(values) >= 9 else (1.0, 1.0, 1.0))
+
+    if len(locations) == 0:
+        print(f"No transform found in '{filepath_p}'")
+        return 1
+    return locations, rotations, scales
+
+
+def place_part_instances(cols:List[bpy.types.Collection], layout:str, target_collection:bpy.types.Collection, origin:Vector,
+                         columns:int=10, spacing:float=1.0, curve_obj:bpy.types.Object=None, csv_filepath:str=''):
+    """Create collection instance for each of 'cols' and lay them out.
+    Args:
+        layout: 'GRID', 'CURVE' or 'CSV'. With 'CSV', number of instances follows rows and cols are cycled.
+    Returns:
+        created instance empties, or 1 on error.
+    """
+    if len(cols) == 0:
+        return 1
+
+    rotations, scales = None, None
+    if layout == 'CSV':
+        result = read_transforms_csv(csv_filepath)
+        if result == 1:
+            return 1
+        locations, rotations, scales = result
+        cols = [cols[i % len(cols)] for i in range(len(locations))]
+    elif layout == 'CURVE':
+        if curve_obj is None or curve_obj.type != 'CURVE':
+            print("Curve object is not specified.")
+            return 1
+        result = compute_curve_transforms(curve_obj, len(cols))
+        if result == 1:
+            return 1
+        locations, rotations = result
+    else:
+        locations = compute_grid_locations(len(cols), columns, spacing, origin)
+
+    return create_part_instance_empties(cols, target_collection, locations, rotations, scales)
+
+
 #-------------------------------------------------------------------------------
 # Rename Move File and Data and Sync Project
 #-------------------------------------------------------------------------------
@@ -853,6 +1097,159 @@ def is_valid_argument_remap_data_sync_project(
 
 
 
+#-------------------------------------------------------------------------------
+# DNT Garbage Collection
+#-------------------------------------------------------------------------------
+def collect_orphaned_dnt_normal_objects_project(dry_run:bool=False):
+    """Remove orphaned DNT normal objects from every blend file in project.
+    Each file is opened, cleaned and saved only if something is removed. Report is written
+    to .md_project/md_dnt_gc_report.json.
+
+    Returns:
+        project report dictionary, or 1 if project is not opened or current file is not saved.
+    """
+    cwd = get_cwd()
+    if cwd is None:
+        print("collect_orphaned_dnt_normal_objects_project: Project is not opened.")
+        return 1
+    if not bpy.data.is_saved:
+        print("collect_orphaned_dnt_normal_objects_project: Save current file first.")
+        return 1
+
+    src_filepath = bpy.data.filepath
+    bpy.ops.wm.save_mainfile()
+
+    file_reports = []
+    for p in myu.find_blend_files(search_path=cwd, exclude_prefix=None):
+        bpy.ops.wm.open_mainfile(filepath=p)
+        file_report = ut.collect_orphaned_dnt_normal_objects(dry_run=dry_run)
+        if (not dry_run) and len(file_report['objects']) > 0:
+            bpy.ops.wm.save_as_mainfile()
+        file_reports.append(file_report)
+
+    bpy.ops.wm.open_mainfile(filepath=src_filepath)
+
+    project_report = {
+        'dry_run': dry_run,
+        'total_objects': sum(len(r['objects']) for r in file_reports),
+        'total_bytes': sum(r['bytes'] for r in file_reports),
+        'files': [r for r in file_reports if len(r['objects']) > 0],
+    }
+    write_dnt_gc_report(project_report)
+    return project_report
+
+
+def write_dnt_gc_report(report:dict):
+    """Write DNT garbage collection report to .md_project/md_dnt_gc_report.json"""
+    md_proj_p = Path(get_cwd())/ct.MD_PROJECT_INFO_FOLDER_NAME
+    md_proj_p.mkdir(exist_ok=True)
+    report_p = md_proj_p/ct.MD_DNT_GC_REPORT_JSON
+    with open(str(report_p), 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"DNT garbage collection report: '{report_p}'")
+    return
+
+
+#-------------------------------------------------------------------------------
+# Library Freshness
+#-------------------------------------------------------------------------------
+class LibraryFreshnessTracker:
+    """Record mtime and size of library files at load, so only libraries changed on disk
+    (e.g. by rename_data_sync_project or other artist) are reloaded.
+    """
+    file_stats:dict = {} # absolute filepath -> (mtime_ns, size)
+
+    @classmethod
+    def get_library_abspath(cls, lib:bpy.types.Library)->str:
+        """Indirect library path is relative to its parent library."""
+        return str(Path(bpy.path.abspath(lib.filepath, library=lib.parent)).resolve())
+
+    @classmethod
+    def get_file_stat(cls, filepath:str)->tuple:
+        """Returns (mtime_ns, size), or None if file is missing."""
+        try:
+            st = Path(filepath).stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def record(cls):
+        """Forget previous record and record all libraries in current file."""
+        cls.file_stats = {}
+        for lib in bpy.data.libraries:
+            filepath = cls.get_library_abspath(lib)
+            cls.file_stats[filepath] = cls.get_file_stat(filepath)
+
+    @classmethod
+    def get_dependency_depth(cls, lib:bpy.types.Library)->int:
+        depth = 0
+        parent = lib.parent
+        while parent is not None:
+            depth += 1
+            parent = parent.parent
+        return depth
+
+    @classmethod
+    def find_changed_libraries(cls)->List[bpy.types.Library]:
+        """Libraries whose file changed since recorded. Library not recorded yet (linked in this session) is recorded and skipped.
+        Missing file is skipped since reload can't succeed.
+        """
+        changed_libs = []
+        for lib in bpy.data.libraries:
+            filepath = cls.get_library_abspath(lib)
+            stat = cls.get_file_stat(filepath)
+            if stat is None:
+                continue
+            if filepath not in cls.file_stats:
+                cls.file_stats[filepath] = stat
+                continue
+            if cls.file_stats[filepath] != stat:
+                changed_libs.append(lib)
+        return changed_libs
+
+    @classmethod
+    def reload_changed_libraries(cls)->List[str]:
+        """Reload changed libraries in dependency order (indirect dependencies first).
+        Returns:
+            filepaths of reloaded libraries.
+        """
+        changed_libs = sorted(cls.find_changed_libraries(), key=cls.get_dependency_depth, reverse=True)
+        targets = [(lib.name, cls.get_library_abspath(lib)) for lib in changed_libs] # library reference may be invalidated by reload.
+
+        reloaded_filepaths = []
+        for lib_name, filepath in targets:
+            lib = bpy.data.libraries.get(lib_name)
+            if lib is None:
+                continue
+            try:
+                lib.reload()
+            except RuntimeError as e:
+                print(f"Failed to reload library '{filepath}': {e}")
+                continue
+            cls.file_stats[filepath] = cls.get_file_stat(filepath)
+            reloaded_filepaths.append(filepath)
+            print(f"Reloaded library: '{filepath}'")
+
+        return reloaded_filepaths
+
+
+@persistent
+def record_library_freshness_on_load(dummy):
+    LibraryFreshnessTracker.record()
+
+def register_library_freshness_tracker():
+    bpy.app.handlers.load_post.append(record_library_freshness_on_load)
+
+def unregister_library_freshness_tracker():
+    if record_library_freshness_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(record_library_freshness_on_load)
+
+register_other(
+    register_func=register_library_freshness_tracker,
+    unregister_func=unregister_library_freshness_tracker)
+
+
 #-------------------------------------------------------------------------------
 # Rename part collection
 #-------------------------------------------------------------------------------
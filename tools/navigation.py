@@ -176,7 +176,7 @@ class Navigation:
             with bpy.context.temp_override(**view_3d_context):
                 scene_child_col = None # direct child collection under scene collection
                 # for part
-                for p_col in [c for c in bpy.data.collections if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION)]:
+                for p_col in ut.PartIndex.get_part_collections():
                     if src_col in p_col.children[:]: # need [:] because CollectionProperty needs to be accessed by string.
                         scene_child_col = p_col
                         break
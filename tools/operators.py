@@ -6,6 +6,7 @@ from . import constants as ct
 from pprint import pprint
 from . import navigation as nav
 from . import md_project as mdp
+from . import profiler as prof
 from ..myblendrc_utils import utils as myu
 from ..myblendrc_utils.common_constants import DataAttrNameDict
 from ..props import get_md_data_id_placeholder
@@ -38,6 +39,102 @@ class MDHARD_OT_sync_dnt(bpy.types.Operator):
         return {"FINISHED"}
 
 
+@register_wrap
+class MDHARD_OT_benchmark_dnt_backend(bpy.types.Operator):
+    """Benchmark DNT backends
+    Compare evaluation time of DATA_TRANSFER and Geometry Nodes DNT normal transfer on active object.
+    """
+    bl_idname = "md_hard.benchmark_dnt_backend"
+    bl_label = "Benchmark DNT Backend"
+    bl_options = {'REGISTER'}
+
+    runs: bpy.props.IntProperty(name='Runs', default=5, min=1, description='Evaluation count per backend. Median is reported') #type: ignore
+
+    @classmethod
+    def poll(self, context:bpy.types.Context):
+        active_obj = context.active_object
+        if active_obj is None:
+            return False
+        else:
+            return active_obj.type == 'MESH' and active_obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME) is not None
+
+    def execute(self, context):
+        results = ut.benchmark_dnt_backends(context.active_object, self.runs)
+        if len(results) == 0:
+            self.report({"WARNING"}, f"DNT normal source object not found. Run Setup DNT first.")
+            return {"CANCELLED"}
+
+        for backend, seconds in results.items():
+            print(f"DNT benchmark '{context.active_object.name}' {backend}: {seconds*1000:.3f} ms")
+
+        self.report({"INFO"}, ", ".join([f"{backend}: {seconds*1000:.3f} ms" for backend, seconds in results.items()]))
+        return {"FINISHED"}
+
+
+@register_wrap
+class MDHARD_OT_profile_dnt_stack(bpy.types.Operator):
+    """Profile DNT modifier stack
+    Measure evaluation cost of each DNT and normal transfer modifier by enabling them one by one.
+    """
+    bl_idname = "md_hard.profile_dnt_stack"
+    bl_label = "Profile DNT Stack"
+    bl_options = {'REGISTER'}
+
+    target: bpy.props.EnumProperty(
+        name='Target',
+        items=[
+            ('SELECTED', 'Selected', 'Selected objects'),
+            ('ACTIVE_PART', 'Active Part', 'Objects in active part collection'),
+            ('SCENE', 'Scene', 'All objects in this scene'),
+        ]) #type: ignore
+    runs: bpy.props.IntProperty(name='Runs', default=3, min=1, description='Evaluation count per modifier. Median is used') #type: ignore
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_props_dialog(self)
+
+    def execute(self, context):
+        objs = prof.get_profile_target_objects(context, self.target)
+        if len(objs) == 0:
+            self.report({"WARNING"}, f"No visible object with DNT modifiers found.")
+            return {"CANCELLED"}
+
+        prof.DNTProfiler.profile(objs, self.runs)
+        self.report({"INFO"}, f"Profiled {len(objs)} objects. See DNT Profiler panel.")
+        return {"FINISHED"}
+
+
+@register_wrap
+class MDHARD_OT_export_dnt_profile_csv(bpy.types.Operator):
+    """Export last DNT profile result as CSV"""
+    bl_idname = "md_hard.export_dnt_profile_csv"
+    bl_label = "Export DNT Profile"
+
+    filepath: bpy.props.StringProperty(name='filepath', default='', subtype='FILE_PATH') # type: ignore
+    filter_glob: bpy.props.StringProperty(
+        default="*.csv",
+        options={'HIDDEN'},
+        )#type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return prof.DNTProfiler.has_result()
+
+    def invoke(self, context, event):
+        self.filepath = "dnt_profile.csv"
+        wm = context.window_manager
+        wm.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        result = prof.DNTProfiler.export_csv(self.filepath)
+        if result == 1:
+            self.report({"WARNING"}, f"Failed to export DNT profile. See system console for more detail.")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"DNT profile exported")
+        return {"FINISHED"}
+
+
 @register_wrap
 class MDHARD_OT_toggle_dnt_visibility(bpy.types.Operator):
     """Toggle DNT visibility
@@ -107,6 +204,44 @@ class MDHARD_OT_normal_transfer(bpy.types.Operator):
 
 
 
+@register_wrap
+class MDHARD_OT_consolidate_normal_transfer(bpy.types.Operator):
+    """Merge MD_NORMAL-* normal transfer sources into one source object and one modifier (Blender 4.5+).
+    Original modifiers are disabled and can be restored. Each vertex samples only its own source.
+    Merged source is a snapshot, run again to follow edits of source objects.
+    """
+    bl_idname = "md_hard.consolidate_normal_transfer"
+    bl_label = "Consolidate Normal Transfer"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    restore: bpy.props.BoolProperty(name="Restore", default=False, description="Remove consolidated modifier and enable original normal transfer modifiers") # type: ignore
+
+    @classmethod
+    def poll(self, context:bpy.types.Context):
+        active_obj = context.active_object
+        return active_obj is not None and active_obj.type == 'MESH'
+
+
+    def execute(self, context):
+        obj = context.active_object
+        if self.restore:
+            result = ut.restore_normal_transfer(obj)
+            msg = "Normal transfer is not consolidated"
+        else:
+            result = ut.consolidate_normal_transfer(obj)
+            msg = "No normal transfer modifier to consolidate"
+
+        if result == 1:
+            self.report({"WARNING"}, msg)
+            return {"CANCELLED"}
+        elif result == 2:
+            self.report({"WARNING"}, "Normal transfer consolidation needs Blender 4.5 or later")
+            return {"CANCELLED"}
+
+        return {"FINISHED"}
+
+
+
 @register_wrap
 class MDHARD_OT_separate_normal_source(bpy.types.Operator):
     """Separates selection as normal transfer source object 
@@ -274,7 +409,7 @@ class MDHARD_OT_set_bevel_weight(bpy.types.Operator):
 @register_wrap
 class MDHARD_OT_set_dnt_bevel_modifier_width(bpy.types.Operator):
     """Set bevel modifier width with the option of keeping the visual thickness.
-    This is effective only for DNT bevel.
+    This is effective only for DNT bevel. All selected objects with DNT bevel are modified.
     """
     bl_idname = "md_hard.set_dnt_bevel_modifier_width"
     bl_label = "Set DNT Bevel Modifier Width"
@@ -282,7 +417,7 @@ class MDHARD_OT_set_dnt_bevel_modifier_width(bpy.types.Operator):
 
     modifier_width: bpy.props.FloatProperty(name='Modifier Width', description='Bevel modifier width ', min=0.0, precision=5, unit='LENGTH') #type: ignore
     keep_visual_width: bpy.props.BoolProperty(name='Keep Visual Width', default=False, description='Bevel Modifier Width.') # type: ignore
-    orig_width:float = 0.0
+    orig_widths:dict = {}
 
     @classmethod
     def poll(self, context:bpy.types.Context):
@@ -296,18 +431,22 @@ class MDHARD_OT_set_dnt_bevel_modifier_width(bpy.types.Operator):
     def invoke(self, context, event):
         wm = context.window_manager
         active_obj = context.active_object
-        dnt_bevel_mod = active_obj.modifiers.get(ct.DNT_BEVEL_NAME) 
-        if dnt_bevel_mod is None:
-            self.report({"WARNING"}, f"'{active_obj.name}' does not have {ct.DNT_BEVEL_NAME} modifier. Create before use this operator.")
+        dnt_bevel_objs = ut.get_dnt_bevel_objects(context)
+        if len(dnt_bevel_objs) == 0:
+            self.report({"WARNING"}, f"Selected objects do not have {ct.DNT_BEVEL_NAME} modifier. Create before use this operator.")
             return {"CANCELLED"}
-        else:
-            self.modifier_width = dnt_bevel_mod.width # use as initial value, this is updated during "Adjust last operator."
-            self.orig_width = dnt_bevel_mod.width # this is constant through out "Adunst last operator".
+
+        # this is constant through out "Adunst last operator".
+        self.orig_widths = {o.name: o.modifiers.get(ct.DNT_BEVEL_NAME).width for o in dnt_bevel_objs}
+
+        # use as initial value, this is updated during "Adjust last operator."
+        dnt_bevel_mod = active_obj.modifiers.get(ct.DNT_BEVEL_NAME)
+        self.modifier_width = dnt_bevel_mod.width if dnt_bevel_mod is not None else dnt_bevel_objs[0].modifiers.get(ct.DNT_BEVEL_NAME).width
         return wm.invoke_props_popup(self, event)
         
 
     def execute(self, context):
-        ut.set_dnt_bevel_modifier_width(self.modifier_width, self.keep_visual_width, self.orig_width)
+        ut.set_dnt_bevel_modifier_width(self.modifier_width, self.keep_visual_width, self.orig_widths)
         return {"FINISHED"}
 
 
@@ -475,6 +614,27 @@ class MDHARD_OT_move_scene_collection_ui_list(bpy.types.Operator):
         return {"FINISHED"}
 
 
+@register_wrap
+class MDHARD_OT_sort_scene_collection_ui_list(bpy.types.Operator):
+    """Sort Scene Collection Children inside UI List by name
+    Only collections after the first out of order one are relinked.
+    """
+    bl_idname = "md_hard.sort_scene_collection_ui_list"
+    bl_label = "Sort Collections in UI List"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    parts_first: bpy.props.BoolProperty(name='Parts First', default=True, description="Place part collections before other collections") # type: ignore
+    reverse: bpy.props.BoolProperty(name='Reverse', default=False) # type: ignore
+
+    @classmethod
+    def poll(self, context):
+        return len(context.scene.collection.children) > 0
+        
+    def execute(self, context):
+        ut.sort_scene_collection_children(context.scene, parts_first=self.parts_first, reverse=self.reverse)
+        return {"FINISHED"}
+
+
 @register_wrap
 class MDHARD_OT_part_children_visibility_toggle(bpy.types.Operator):
     """Toggle Visibility of Children Collection Under Part.
@@ -513,9 +673,75 @@ class MDHARD_OT_part_children_visibility_toggle(bpy.types.Operator):
         return {"FINISHED"}
 
 
+@register_wrap
+class MDHARD_OT_save_part_visibility_preset(bpy.types.Operator):
+    """Save current visibility of collections under active part as preset.
+    """
+    bl_idname = "md_hard.save_part_visibility_preset"
+    bl_label = "Save Part Visibility Preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    preset_name: bpy.props.StringProperty(name='Name', default='Preset') # type: ignore
+    all_parts: bpy.props.BoolProperty(name='All Parts', default=False, description="Store the same preset in every local part") # type: ignore
+
+    @classmethod
+    def poll(self, context):
+        return ut.poll_is_ui_list_active_collection_part(self, context)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        if self.preset_name == '':
+            self.report({"WARNING"}, f"Specify preset name.")
+            return {"CANCELLED"}
+
+        part_collection = getattr(context.scene, ct.ACTIVE_PART_COLLECTION)
+        mask = ut.get_part_visibility_mask(part_collection)
+        part_collections = [c for c in ut.PartIndex.get_part_collections() if c.library is None] if self.all_parts else [part_collection]
+        for part_col in part_collections:
+            ut.save_part_visibility_preset(part_col, self.preset_name, mask)
+
+        self.report({"INFO"}, f"Saved visibility preset '{self.preset_name}' to {len(part_collections)} parts.")
+        return {"FINISHED"}
+
+
+@register_wrap
+class MDHARD_OT_apply_part_visibility_preset(bpy.types.Operator):
+    """Apply visibility preset to active part or all parts.
+    Parts without the preset use the preset of active part.
+    """
+    bl_idname = "md_hard.apply_part_visibility_preset"
+    bl_label = "Apply Part Visibility Preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    preset: bpy.props.EnumProperty(name='Preset', items=ut.part_visibility_preset_items_callback) # type: ignore
+    all_parts: bpy.props.BoolProperty(name='All Parts', default=False, description="Apply to every local part") # type: ignore
+
+    @classmethod
+    def poll(self, context):
+        return ut.poll_is_ui_list_active_collection_part(self, context)
+
+    def invoke(self, context, event):
+        self.all_parts = event.shift
+        return self.execute(context)
+
+    def execute(self, context):
+        part_collection = getattr(context.scene, ct.ACTIVE_PART_COLLECTION)
+        fallback_mask = ut.find_part_visibility_preset_mask(part_collection, self.preset)
+        part_collections = [c for c in ut.PartIndex.get_part_collections() if c.library is None] if self.all_parts else [part_collection]
+
+        applied_count = ut.apply_part_visibility_preset(part_collections, self.preset, context.view_layer, fallback_mask=fallback_mask)
+        if applied_count == 0:
+            self.report({"WARNING"}, f"Preset '{self.preset}' not found.")
+            return {"CANCELLED"}
+        return {"FINISHED"}
+
+
 @register_wrap
 class MDHARD_OT_md_remove_unused_dnt_normal_objects(bpy.types.Operator):
     """Remove unused DNT normal objects in DNT-{Part.name} collection
+    Objects not referred by any DNT modifier in all scenes are removed.
     """
     bl_idname = "md_hard.md_remove_unused_dnt_normal_objects"
     bl_label = "Remove Unused DNT Normal Objects"
@@ -525,25 +751,11 @@ class MDHARD_OT_md_remove_unused_dnt_normal_objects(bpy.types.Operator):
     # def poll(self, context:bpy.types.Context):
     #     return context.active_object is not None
     unused_dnt_objs = []
-    used_dnt_objs = []
 
 
     def invoke(self, context, event):
         wm = context.window_manager
-        self.unused_dnt_objs = []
-        self.used_dnt_objs = []
-        dnt_normal_objs = [o for o in context.scene.objects if getattr(o, ct.IS_DNT_NORMAL_OBJECT)]
-
-
-
-        scene_mesh_objs = [o for o in context.scene.objects if o.type == 'MESH']
-        for o in scene_mesh_objs:
-            dnt_normal_mod = o.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME)
-            if dnt_normal_mod is not None:
-                self.used_dnt_objs.append(dnt_normal_mod.object)
-        
-        
-        self.unused_dnt_objs = list(set(dnt_normal_objs) - set(self.used_dnt_objs))
+        self.unused_dnt_objs = ut.find_orphaned_dnt_normal_objects()
         return wm.invoke_props_dialog(self)
         
     def execute(self, context):
@@ -563,6 +775,41 @@ class MDHARD_OT_md_remove_unused_dnt_normal_objects(bpy.types.Operator):
 
         
 
+@register_wrap
+class MDHARD_OT_collect_dnt_normal_objects_project(bpy.types.Operator):
+    """Remove orphaned DNT normal objects from every blend file in project
+    Each file is opened and saved. Report is written to .md_project folder.
+    """
+    bl_idname = "md_hard.collect_dnt_normal_objects_project"
+    bl_label = "Collect Orphaned DNT Normal Objects In Project"
+
+    dry_run: bpy.props.BoolProperty(name="Dry Run", default=True, description="Only write report without removing objects") # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return bpy.data.is_saved and (mdp.get_cwd() is not None)
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_props_dialog(self)
+
+    def execute(self, context):
+        report = mdp.collect_orphaned_dnt_normal_objects_project(dry_run=self.dry_run)
+        if report == 1:
+            self.report({'WARNING'}, f"Project is not opened or file is not saved.")
+            return {"CANCELLED"}
+
+        verb = "Found" if self.dry_run else "Removed"
+        self.report({'INFO'}, f"{verb} {report['total_objects']} orphaned DNT normal objects ({report['total_bytes'] / 1024:.1f} KB)")
+        return {"FINISHED"}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Every file in project will be opened and saved.", icon="ERROR")
+        layout.prop(self, 'dry_run')
+
+
+
 @register_wrap
 class MDHARD_OT_face_strength_material_override_toggle(bpy.types.Operator):
     """Toggle Face Strength Material Override"""
@@ -582,17 +829,24 @@ class MDHARD_OT_face_strength_material_override_toggle(bpy.types.Operator):
 
 @register_wrap
 class MDHARD_OT_fix_part_render_viewport_visibilities(bpy.types.Operator):
-    """Fix Render and Viewport Visibility of Active Part collection."""
+    """Fix Render and Viewport Visibility of Active Part collection.
+    If all_parts is True, every local part collection in this file is fixed.
+    """
     bl_idname = "md_hard.fix_part_render_viewport_visibilities"
     bl_label = "Fix Render and Viewport Visibility of Active Part collections."
     bl_options = {'REGISTER', 'UNDO'}
 
-    @classmethod
-    def poll(cls, context):
-        return getattr(context.scene, ct.ACTIVE_PART_COLLECTION) is not None
+    all_parts: bpy.props.BoolProperty(name="All Parts", default=False, description="Fix every local part collection in this file") # type: ignore
 
     def execute(self, context):
-        ut.fix_part_render_and_viewport_visibilities()
+        if self.all_parts:
+            changed_count = ut.fix_all_parts_render_and_viewport_visibilities()
+            self.report({"INFO"}, f"Fix Render and Viewport Visibility of All Part collections: {changed_count} changed.")
+            return {"FINISHED"}
+
+        if ut.fix_part_render_and_viewport_visibilities() == 1:
+            self.report({"WARNING"}, f"No active part collection.")
+            return {"CANCELLED"}
         self.report({"INFO"}, f"Fix Render and Viewport Visibility of Active Part collections called.")
         return {"FINISHED"}
 
@@ -957,6 +1211,7 @@ class MDHARD_OT_link_part(bpy.types.Operator):
         name='part_path', 
         items=mdp.search_parts_in_project_callback, 
         description='The format is abs/path/to/*.blend|data_id|name') # type: ignore
+    use_proxy: bpy.props.BoolProperty(name='Use Proxy', default=False, description="Link proxy instead of part if it is generated in source file") # type: ignore
     
     @classmethod
     def poll(cls, context):
@@ -973,11 +1228,226 @@ class MDHARD_OT_link_part(bpy.types.Operator):
             return {'FINISHED'}
     
     def execute(self, context):
-        mdp.link_part(self.part_path)
+        mdp.link_part(self.part_path, use_proxy=self.use_proxy)
         print(f"'{self.part_path}' Linked")
         return {"FINISHED"}
+
+
+@register_wrap
+class MDHARD_OT_link_parts_bulk(bpy.types.Operator):
+    """Link multiple 'F-' Collections in project into current scene.
+    Each source file is loaded only once.
+    """
+    bl_idname = "md_hard.link_parts_bulk"
+    bl_label = "MD Link Parts in Project"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_proxy: bpy.props.BoolProperty(name='Use Proxy', default=False, description="Link proxy instead of part if it is generated in source file") # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return bpy.context.mode == 'OBJECT'
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        if mdp.get_cwd() is None:
+            self.report({"WARNING"}, f"MD Project not opened.")
+            return {'CANCELLED'}
+
+        mdp.update_link_part_candidates(wm)
+        return wm.invoke_props_dialog(self, width=450)
+
+    def draw(self, context):
+        wm = context.window_manager
+        layout = self.layout
+        layout.template_list("MDHARD_UL_link_part_candidate", "", wm, ct.MD_LINK_PART_CANDIDATES, wm, ct.MD_LINK_PART_CANDIDATES_INDEX, rows=10)
+        layout.prop(self, 'use_proxy')
+
+    def execute(self, context):
+        wm = context.window_manager
+        id_paths = [c.id_path for c in getattr(wm, ct.MD_LINK_PART_CANDIDATES) if c.select]
+        if len(id_paths) == 0:
+            self.report({"WARNING"}, f"No part selected.")
+            return {"CANCELLED"}
+
+        new_part_objs = mdp.link_parts(id_paths, target_collection=context.collection, use_proxy=self.use_proxy)
+        for o in context.selected_objects:
+            o.select_set(False)
+        for o in new_part_objs:
+            o.select_set(True)
+        if len(new_part_objs) > 0:
+            context.view_layer.objects.active = new_part_objs[-1]
+
+        self.report({"INFO"}, f"{len(new_part_objs)} parts linked.")
+        return {"FINISHED"}
     
 
+@register_wrap
+class MDHARD_OT_generate_part_proxies(bpy.types.Operator):
+    """Generate lightweight proxy of each local 'F-' collection. Proxies are stored in this file as 'PROXY-' collections
+    and can be linked instead of the parts.
+    """
+    bl_idname = "md_hard.generate_part_proxies"
+    bl_label = "MD Generate Part Proxies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    proxy_type: bpy.props.EnumProperty(
+        name='Proxy',
+        items=[
+            ('BOUNDS', 'Bounding Box', 'Bounding box of part'),
+            ('HULL', 'Hull', 'Convex hull of decimated vertices of part'),
+            ],
+        default='BOUNDS') # type: ignore
+    max_points_per_object: bpy.props.IntProperty(name='Max Points Per Object', default=256, min=4, description="Vertices of each object are decimated to this count before building hull") # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        part_cols = [c for c in bpy.data.collections if c.library is None and c.name.startswith(f"{ct.FINAL_COLLECTION}-")]
+        generated_count = ut.generate_part_proxies(part_cols, self.proxy_type, self.max_points_per_object)
+        if generated_count == 0:
+            self.report({"WARNING"}, f"No proxy generated.")
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"{generated_count} proxies generated. Save file to make them available for linking.")
+        return {"FINISHED"}
+
+
+@register_wrap
+class MDHARD_OT_swap_part_proxies(bpy.types.Operator):
+    """Swap selected part instances between part and its proxy.
+    """
+    bl_idname = "md_hard.swap_part_proxies"
+    bl_label = "MD Swap Part Proxies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    swap_to: bpy.props.EnumProperty(
+        name='Swap To',
+        items=[
+            ('TOGGLE', 'Toggle', 'Toggle each selected instance'),
+            ('PROXY', 'Proxy', 'Swap to proxy'),
+            ('PART', 'Part', 'Swap to full part'),
+            ],
+        default='TOGGLE') # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and any(o.instance_type == 'COLLECTION' and o.instance_collection is not None for o in context.selected_objects)
+
+    def execute(self, context):
+        to_proxy = {'TOGGLE': None, 'PROXY': True, 'PART': False}[self.swap_to]
+        swapped_count = mdp.swap_part_proxies(context.selected_objects, to_proxy=to_proxy)
+        if swapped_count == 0:
+            self.report({"WARNING"}, f"Nothing swapped. Generate proxies in source file first.")
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"{swapped_count} instances swapped.")
+        return {"FINISHED"}
+
+
+@register_wrap
+class MDHARD_OT_place_part_instances(bpy.types.Operator):
+    """Create collection instances of selected part instances and lay them out on grid, along curve or from CSV.
+    """
+    bl_idname = "md_hard.place_part_instances"
+    bl_label = "MD Place Part Instances"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: bpy.props.EnumProperty(
+        name='Source',
+        items=[
+            ('COPIES', 'Copies of Active', 'N copies of active instance collection'),
+            ('EACH', 'Each Selected', 'One copy of each selected instance collection'),
+            ],
+        default='COPIES') # type: ignore
+    layout_type: bpy.props.EnumProperty(
+        name='Layout',
+        items=[
+            ('GRID', 'Grid', 'Grid on XY plane starting at 3D cursor'),
+            ('CURVE', 'Curve', 'Distribute along curve'),
+            ('CSV', 'CSV', "Transforms from CSV rows 'x,y,z[,rx,ry,rz[,sx,sy,sz]]'"),
+            ],
+        default='GRID') # type: ignore
+    count: bpy.props.IntProperty(name='Count', default=10, min=1) # type: ignore
+    columns: bpy.props.IntProperty(name='Columns', default=10, min=1) # type: ignore
+    spacing: bpy.props.FloatProperty(name='Spacing', default=1.0, subtype='DISTANCE') # type: ignore
+    curve_name: bpy.props.StringProperty(name='Curve', default='') # type: ignore
+    filepath: bpy.props.StringProperty(name='CSV', default='', subtype='FILE_PATH') # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and any(o.instance_type == 'COLLECTION' and o.instance_collection is not None for o in context.selected_objects)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, 'source')
+        if self.source == 'COPIES' and self.layout_type != 'CSV':
+            layout.prop(self, 'count')
+        layout.prop(self, 'layout_type')
+        if self.layout_type == 'GRID':
+            layout.prop(self, 'columns')
+            layout.prop(self, 'spacing')
+        elif self.layout_type == 'CURVE':
+            layout.prop_search(self, 'curve_name', context.scene, 'objects')
+        else:
+            layout.prop(self, 'filepath')
+
+    def execute(self, context):
+        if self.source == 'COPIES':
+            active_obj = context.active_object
+            if active_obj is None or active_obj.instance_collection is None:
+                self.report({"WARNING"}, f"Active object is not collection instance.")
+                return {"CANCELLED"}
+            cols = [active_obj.instance_collection] * self.count
+        else:
+            cols = [o.instance_collection for o in context.selected_objects if o.instance_type == 'COLLECTION' and o.instance_collection is not None]
+
+        result = mdp.place_part_instances(
+            cols,
+            self.layout_type,
+            target_collection=context.collection,
+            origin=context.scene.cursor.location,
+            columns=self.columns,
+            spacing=self.spacing,
+            curve_obj=context.scene.objects.get(self.curve_name),
+            csv_filepath=self.filepath)
+        if result == 1:
+            self.report({"WARNING"}, f"Failed to place instances. See system console for more detail.")
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"{len(result)} instances placed.")
+        return {"FINISHED"}
+
+
+@register_wrap
+class MDHARD_OT_reload_changed_libraries(bpy.types.Operator):
+    """Reload only libraries whose file changed on disk since this file was loaded.
+    """
+    bl_idname = "md_hard.reload_changed_libraries"
+    bl_label = "MD Reload Changed Libraries"
+
+    @classmethod
+    def poll(cls, context):
+        return len(bpy.data.libraries) > 0
+
+    def execute(self, context):
+        reloaded_filepaths = mdp.LibraryFreshnessTracker.reload_changed_libraries()
+        if len(reloaded_filepaths) == 0:
+            self.report({"INFO"}, f"All libraries are up to date.")
+            return {"FINISHED"}
+
+        self.report({"INFO"}, f"{len(reloaded_filepaths)} libraries reloaded: {', '.join(Path(p).name for p in reloaded_filepaths)}")
+        return {"FINISHED"}
+
+
 @register_wrap
 class MDHARD_OT_rename_data_sync_project(bpy.types.Operator):
     """Rename Data and Sync Project reference
@@ -0,0 +1,160 @@
+"""DNT Profiler
+Measure which DNT modifier dominates evaluation cost of each object's stack.
+Each modifier is enabled one by one in stack order, and the difference of evaluation time is
+treated as the cost of the modifier.
+"""
+
+
+import bpy
+import csv
+from pathlib import Path
+from typing import List
+from . import constants as ct
+from . import utils as ut
+
+
+class ModifierCost:
+    """Store evaluation cost of one modifier."""
+    def __init__(self, obj_name:str, part_name:str, modifier_name:str, modifier_type:str, seconds:float):
+        self.obj_name:str = obj_name
+        self.part_name:str = part_name # empty if object is not under part collection.
+        self.modifier_name:str = modifier_name
+        self.modifier_type:str = modifier_type
+        self.seconds:float = seconds
+
+
+class PartCost:
+    """Store evaluation cost of objects in one part."""
+    def __init__(self, part_name:str):
+        self.part_name:str = part_name
+        self.object_count:int = 0
+        self.base_seconds:float = 0.0 # stack without profiled modifiers
+        self.dnt_seconds:float = 0.0 # sum of profiled modifiers
+
+    @property
+    def total_seconds(self)->float:
+        return self.base_seconds + self.dnt_seconds
+
+
+def is_profiled_modifier(mod:bpy.types.Modifier)->bool:
+    """Check if modifier is DNT or normal transfer modifier generated by this addon."""
+    dnt_modifier_names = [ct.DNT_WEIGHTED_NORMAL_NAME, ct.DNT_BEVEL_NAME, ct.DNT_NORMAL_TRANSFER_NAME, ct.MD_NORMAL_CONSOLIDATED_NAME]
+    return mod.name in dnt_modifier_names or mod.name.startswith(f"{ct.MD_NORMAL_TRANSFER_NAME}-")
+
+
+def get_profile_target_objects(context:bpy.types.Context, target:str)->List[bpy.types.Object]:
+    """Get visible mesh objects which have DNT modifiers.
+
+    Args:
+        target: 'SELECTED', 'ACTIVE_PART' or 'SCENE'
+    """
+    if target == 'SELECTED':
+        objs = context.selected_objects
+    elif target == 'ACTIVE_PART':
+        part_collection = getattr(context.scene, ct.ACTIVE_PART_COLLECTION)
+        objs = part_collection.all_objects[:] if part_collection is not None else []
+    else:
+        objs = context.scene.objects[:]
+
+    return [
+        o for o in objs
+        if o.type == 'MESH' and o.visible_get() and any(is_profiled_modifier(m) for m in o.modifiers)
+        ]
+
+
+class DNTProfiler:
+    """Keep result of the last profiling. Result is shared by operators and panel."""
+    modifier_costs:List[ModifierCost] = []
+    part_costs:List[PartCost] = []
+    runs:int = 0
+
+    @classmethod
+    def clear(cls):
+        cls.modifier_costs = []
+        cls.part_costs = []
+        cls.runs = 0
+
+    @classmethod
+    def has_result(cls)->bool:
+        return len(cls.modifier_costs) > 0
+
+    @classmethod
+    def profile(cls, objs:List[bpy.types.Object], runs:int=5):
+        """Profile DNT modifier stack of given objects.
+        Modifier visibility is always restored even if evaluation fails.
+        """
+        cls.clear()
+        cls.runs = runs
+        part_cost_dict = {}
+
+        for obj in objs:
+            part_collection = ut.get_parent_part_collection(obj)
+            part_name = part_collection.name if part_collection is not None else ''
+            base_seconds, costs = cls._profile_object(obj, part_name, runs)
+
+            part_cost = part_cost_dict.setdefault(part_name, PartCost(part_name))
+            part_cost.object_count += 1
+            part_cost.base_seconds += base_seconds
+            part_cost.dnt_seconds += sum(c.seconds for c in costs)
+            cls.modifier_costs += costs
+
+        cls.modifier_costs.sort(key=lambda c: c.seconds, reverse=True)
+        cls.part_costs = sorted(part_cost_dict.values(), key=lambda p: p.total_seconds, reverse=True)
+        return
+
+    @classmethod
+    def _profile_object(cls, obj:bpy.types.Object, part_name:str, runs:int):
+        """Enable profiled modifiers one by one and measure increase of evaluation time.
+        Modifiers hidden by user are skipped and keep hidden.
+
+        Returns:
+            base_seconds: evaluation time without profiled modifiers.
+            costs: list of ModifierCost in stack order.
+        """
+        profiled_mods = [m for m in obj.modifiers if is_profiled_modifier(m)]
+        orig_show_viewport = {m.name: m.show_viewport for m in profiled_mods}
+        costs = []
+
+        try:
+            for m in profiled_mods:
+                m.show_viewport = False
+            base_seconds = ut.time_object_evaluation(obj, runs)
+
+            prev_seconds = base_seconds
+            for m in profiled_mods:
+                if not orig_show_viewport[m.name]:
+                    continue
+                m.show_viewport = True
+                seconds = ut.time_object_evaluation(obj, runs)
+                costs.append(ModifierCost(obj.name, part_name, m.name, m.type, max(seconds - prev_seconds, 0.0)))
+                prev_seconds = seconds
+        finally:
+            for m in profiled_mods:
+                m.show_viewport = orig_show_viewport[m.name]
+
+        return base_seconds, costs
+
+    @classmethod
+    def export_csv(cls, filepath:str):
+        """Export last result as csv. Both modifier rows and part total rows are written.
+        """
+        if not cls.has_result():
+            print("No profile result to export.")
+            return 1
+
+        filepath_p = Path(bpy.path.abspath(filepath))
+        if not filepath_p.parent.exists():
+            print(f"Directory not found: '{filepath_p.parent}'")
+            return 1
+
+        with open(str(filepath_p), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['kind', 'part', 'object', 'modifier', 'modifier_type', 'ms', 'runs'])
+            for c in cls.modifier_costs:
+                writer.writerow(['modifier', c.part_name, c.obj_name, c.modifier_name, c.modifier_type, f"{c.seconds*1000:.4f}", cls.runs])
+            for p in cls.part_costs:
+                writer.writerow(['part_dnt', p.part_name, p.object_count, '', '', f"{p.dnt_seconds*1000:.4f}", cls.runs])
+                writer.writerow(['part_total', p.part_name, p.object_count, '', '', f"{p.total_seconds*1000:.4f}", cls.runs])
+
+        print(f"DNT profile exported: '{filepath_p}'")
+        return
@@ -3,6 +3,7 @@ from ..setup_tools.register import register_wrap
 from . import constants as ct
 from . import operators as ot
 from . import utils as ut
+from . import profiler as prof
 
 
 @register_wrap
@@ -27,13 +28,16 @@ class MDHARD_PT_md_hard(bpy.types.Panel):
         split.operator(ot.MDHARD_OT_regenerate_collections_under_part.bl_idname, text="", icon="FILE_REFRESH")
         row = layout.row()
         row.operator(ot.MDHARD_OT_rename_part_collection.bl_idname, text="Rename Part")
-        row.operator(ot.MDHARD_OT_fix_part_render_viewport_visibilities.bl_idname, text="Fix Visibility")
+        sub = row.row(align=True)
+        sub.operator(ot.MDHARD_OT_fix_part_render_viewport_visibilities.bl_idname, text="Fix Visibility").all_parts = False
+        sub.operator(ot.MDHARD_OT_fix_part_render_viewport_visibilities.bl_idname, text="", icon="WORLD").all_parts = True
 
         layout.separator(factor=2.0)
         layout.prop(bpy.context.scene, ct.IS_MD_FACE_STRENGTH_MATERIAL_OVERRIDE, text="Face Strength Override", icon="MATERIAL", expand=True)
 
         layout.separator()
-        active_uilist_collection = getattr(sn, ct.ACTIVE_UILIST_COLLECTION)
+        panel_state = ut.PanelViewModel.get(sn)
+        active_uilist_collection = panel_state.active_uilist_collection
         active_collection_name = ''
         if active_uilist_collection is not None:
            active_collection_name = active_uilist_collection.name
@@ -43,7 +47,7 @@ class MDHARD_PT_md_hard(bpy.types.Panel):
         row.label(text=f"Active: {active_collection_name}")
         if active_uilist_collection is not None:
             row.prop(active_uilist_collection, ct.IS_MD_HARDSURF_SUB_PART_COLLECTION, text="Sub Part")
-            if getattr(active_uilist_collection, ct.IS_MD_HARDSURF_PART_COLLECTION) == False:
+            if panel_state.is_part == False:
                 row.enabled = False
                 
 
@@ -54,6 +58,7 @@ class MDHARD_PT_md_hard(bpy.types.Panel):
         col.operator(ot.MDHARD_OT_move_scene_collection_ui_list.bl_idname, text="", icon='TRIA_UP').move_type = 'UP'
         col.operator(ot.MDHARD_OT_move_scene_collection_ui_list.bl_idname, text="", icon='TRIA_DOWN').move_type = 'DOWN'
         col.separator()
+        col.operator(ot.MDHARD_OT_sort_scene_collection_ui_list.bl_idname, text="", icon='SORTALPHA')
 
         row = layout.row(align=True)
         row.operator(ot.MDHARD_OT_link_part_colleciton_to_scene.bl_idname, text="Link", icon='LINKED')
@@ -64,20 +69,25 @@ class MDHARD_PT_md_hard(bpy.types.Panel):
         row = layout.row(align=True)
         row.scale_y = 1.5
 
-        current_uilist_scene_collection = getattr(sn, ct.ACTIVE_UILIST_COLLECTION) # This scene property is both return part or non part collection.
+        current_uilist_scene_collection = panel_state.active_uilist_collection # This is both part or non part collection.
         if current_uilist_scene_collection is not None:
-            visibilities = ut.PartManager.get_collection_visibility_dict(part_collection=current_uilist_scene_collection)
+            visibilities = panel_state.visibilities
             icon_set = lambda prefix: "HIDE_OFF" if visibilities.get(prefix, False) else "HIDE_ON"
             row.operator(ot.MDHARD_OT_part_children_visibility_toggle.bl_idname, text="F-", icon=icon_set(ct.FINAL_COLLECTION)).collection_prefix = ct.FINAL_COLLECTION
             row.operator(ot.MDHARD_OT_part_children_visibility_toggle.bl_idname, text="DEP-", icon=icon_set(ct.DEP_COLLECTION)).collection_prefix = ct.DEP_COLLECTION
             row.operator(ot.MDHARD_OT_part_children_visibility_toggle.bl_idname, text="D-", icon=icon_set(ct.DESIGN_COLLECTION)).collection_prefix = ct.DESIGN_COLLECTION
             row.operator(ot.MDHARD_OT_part_children_visibility_toggle.bl_idname, text="NORMAL-", icon=icon_set(ct.NORMAL_COLLECTION)).collection_prefix = ct.NORMAL_COLLECTION
 
-            if getattr(current_uilist_scene_collection, ct.IS_MD_HARDSURF_PART_COLLECTION):
+            if panel_state.is_part:
                 row.enabled = True
             else:
                 row.enabled = False
 
+            row = layout.row(align=True)
+            row.operator_menu_enum(ot.MDHARD_OT_apply_part_visibility_preset.bl_idname, 'preset', text="Visibility Preset", icon="PRESET")
+            row.operator(ot.MDHARD_OT_save_part_visibility_preset.bl_idname, text="", icon="ADD")
+            row.enabled = panel_state.is_part
+
         return
     
     
@@ -93,7 +103,7 @@ class MDHARD_PT_md_normal_transfer(bpy.types.Panel):
 
     def draw(self, context):
         active_obj = context.active_object
-        part_collection = getattr(bpy.context.scene, ct.ACTIVE_PART_COLLECTION)
+        part_collection = ut.PanelViewModel.get(context.scene).active_part_collection
 
         layout = self.layout
         col = layout.column(heading="Normal Transfer")
@@ -106,6 +116,15 @@ class MDHARD_PT_md_normal_transfer(bpy.types.Panel):
             split.operator(ot.MDHARD_OT_separate_normal_source.bl_idname, text="", icon="MOD_EXPLODE")
             split.operator(ot.MDHARD_OT_normal_transfer.bl_idname, text="Normal Transfer", icon="MOD_DATA_TRANSFER")
 
+            if active_obj is not None and active_obj.type == 'MESH':
+                row = col.row(align=True)
+                if ut.is_normal_transfer_consolidated(active_obj):
+                    row.operator(ot.MDHARD_OT_consolidate_normal_transfer.bl_idname, text="Restore Normal Transfer", icon="LOOP_BACK").restore = True
+                    row.operator(ot.MDHARD_OT_consolidate_normal_transfer.bl_idname, text="", icon="FILE_REFRESH").restore = False
+                    col.label(text="Snapshot of sources. Refresh after editing them.", icon="INFO")
+                else:
+                    row.operator(ot.MDHARD_OT_consolidate_normal_transfer.bl_idname, text="Consolidate Normal Transfer", icon="AUTOMERGE_ON").restore = False
+
         else:
             col.label(text=f"Active Part: None")
 
@@ -114,6 +133,48 @@ class MDHARD_PT_md_normal_transfer(bpy.types.Panel):
         row = layout.row()
         row.scale_y = 1.7
         row.operator(ot.MDHARD_OT_sync_dnt.bl_idname, text="Sync DNT", icon="FILE_REFRESH")    
+        row.operator(ot.MDHARD_OT_benchmark_dnt_backend.bl_idname, text="", icon="TIME")
+
+        return
+
+
+
+@register_wrap
+class MDHARD_PT_dnt_profiler(bpy.types.Panel):
+    """Panel for DNT profiler result
+    """
+    bl_idname = "MDHARD_PT_dnt_profiler" 
+    bl_label = "DNT Profiler"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "MD Hard" # tab name
+    bl_options = {'DEFAULT_CLOSED'}
+
+    max_rows = 20
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row(align=True)
+        row.operator(ot.MDHARD_OT_profile_dnt_stack.bl_idname, text="Profile", icon="TIME")
+        row.operator(ot.MDHARD_OT_export_dnt_profile_csv.bl_idname, text="Export CSV", icon="EXPORT")
+
+        if not prof.DNTProfiler.has_result():
+            layout.label(text="No profile result.")
+            return
+
+        box = layout.box()
+        box.label(text=f"Modifiers (median of {prof.DNTProfiler.runs} runs)", icon="MODIFIER")
+        for c in prof.DNTProfiler.modifier_costs[:self.max_rows]:
+            split = box.split(factor=0.75)
+            split.label(text=f"{c.obj_name} / {c.modifier_name}")
+            split.label(text=f"{c.seconds*1000:.2f} ms")
+
+        box = layout.box()
+        box.label(text="Parts (DNT / Total)", icon="COLLECTION_COLOR_01")
+        for p in prof.DNTProfiler.part_costs[:self.max_rows]:
+            split = box.split(factor=0.5)
+            split.label(text=p.part_name if p.part_name != '' else "(No Part)")
+            split.label(text=f"{p.dnt_seconds*1000:.2f} / {p.total_seconds*1000:.2f} ms")
 
         return
 
@@ -124,6 +185,62 @@ class MDHARD_PT_md_normal_transfer(bpy.types.Panel):
 #-------------------------------------------------------------------------------
 @register_wrap
 class MDHARD_UL_scene_part(bpy.types.UIList):
+    filter_part_type: bpy.props.EnumProperty(
+        name="Type",
+        items=[
+            ('ALL', 'All', 'Show all collections'),
+            ('PART', 'Part', 'Show only part collections'),
+            ('NON_PART', 'Non Part', 'Show only non part collections'),
+        ],
+        default='ALL'
+    ) # type: ignore
+    use_sort_recent: bpy.props.BoolProperty(name="Sort by Recent Use", default=False, description="Recently activated collections come first") # type: ignore
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, 'filter_name', text="")
+        row.prop(self, 'use_filter_invert', text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, 'filter_part_type', expand=True)
+        row = layout.row(align=True)
+        row.prop(self, 'use_filter_sort_alpha', text="", icon='SORTALPHA')
+        row.prop(self, 'use_sort_recent', text="", icon='TIME')
+        row.prop(self, 'use_filter_sort_reverse', text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        cache_key = (
+            context.scene.session_uid, len(items), self.filter_name, self.filter_part_type,
+            self.use_filter_sort_alpha, self.use_sort_recent,
+            ) # reverse is applied by Blender to returned order, not part of cached result.
+        cached = ut.SceneCollectionListCache.entries.get(cache_key)
+        if cached is not None:
+            return cached
+
+        helper = bpy.types.UI_UL_list
+        flt_flags = []
+        if self.filter_name or self.filter_part_type != 'ALL':
+            if self.filter_name:
+                flt_flags = helper.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "name")
+            else:
+                flt_flags = [self.bitflag_filter_item] * len(items)
+            if self.filter_part_type != 'ALL':
+                want_part = self.filter_part_type == 'PART'
+                for i, c in enumerate(items):
+                    if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION) != want_part:
+                        flt_flags[i] &= ~self.bitflag_filter_item
+
+        flt_neworder = []
+        if self.use_sort_recent:
+            sort_data = [(i, -ut.SceneCollectionListCache.get_recent_use(c)) for i, c in enumerate(items)]
+            flt_neworder = helper.sort_items_helper(sort_data, lambda e: e[1], reverse=False)
+        elif self.use_filter_sort_alpha:
+            sort_data = [(i, c.name.lower()) for i, c in enumerate(items)]
+            flt_neworder = helper.sort_items_helper(sort_data, lambda e: e[1], reverse=False)
+
+        ut.SceneCollectionListCache.entries[cache_key] = (flt_flags, flt_neworder)
+        return flt_flags, flt_neworder
+
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
             part_col = item # scene.collection.children ()
@@ -144,6 +261,22 @@ class MDHARD_UL_scene_part(bpy.types.UIList):
 
 
 
+#-------------------------------------------------------------------------------
+# Bulk Link Part
+#-------------------------------------------------------------------------------
+@register_wrap
+class MDHARD_UL_link_part_candidate(bpy.types.UIList):
+    def draw_item(self, context, layout:bpy.types.UILayout, data, item, icon, active_data, active_propname, index):
+        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+            row = layout.row(align=True)
+            row.prop(item, 'select', text="")
+            row.label(text=item.name, icon='OUTLINER_COLLECTION')
+
+        elif self.layout_type == 'GRID':
+            layout.alignment = 'CENTER'
+            layout.label(text="")
+
+
 #-------------------------------------------------------------------------------
 # Harpoon
 #-------------------------------------------------------------------------------
@@ -236,6 +369,10 @@ class MDHARD_MT_md_hard_surface(bpy.types.Menu):
             col.operator_context = 'INVOKE_DEFAULT'
             col.operator(ot.MDHARD_OT_open_file_in_project.bl_idname, text="P Open File in Project")
             col.operator(ot.MDHARD_OT_link_part.bl_idname, text="A Link Part")
+            col.operator(ot.MDHARD_OT_link_parts_bulk.bl_idname, text="Link Parts (Bulk)")
+            col.operator(ot.MDHARD_OT_place_part_instances.bl_idname, text="Place Part Instances")
+            col.operator(ot.MDHARD_OT_swap_part_proxies.bl_idname, text="Swap Part Proxies")
+            col.operator(ot.MDHARD_OT_generate_part_proxies.bl_idname, text="Generate Part Proxies")
         except AttributeError:
             # Exception when you have not selected anything.
             # When you have not selected mesh, you cannot check the line
@@ -325,6 +462,7 @@ class MDHARD_MT_project_submenu(bpy.types.Menu):
                 layout.operator(ot.MDHARD_OT_go_to_source_collection.bl_idname, text="S Go To Source", icon="OUTLINER_COLLECTION")
                 # layout.operator(ot.MDHARD_OT_navigate_forward.bl_idname, text="F Navigate Forward", icon="LOOP_FORWARDS")
                 # layout.operator(ot.MDHARD_OT_navigate_back.bl_idname, text="B Navigate Backward", icon="LOOP_BACK") # TODO create better keymap for nav back/forward
+                layout.operator(ot.MDHARD_OT_reload_changed_libraries.bl_idname, text="R Reload Changed Libraries", icon="FILE_REFRESH")
                 layout.operator(ot.MDHARD_OT_open_project.bl_idname, text="O Open Project")
                 layout.operator(ot.MDHARD_OT_close_project.bl_idname, text="C Close Project")
             # if context.area.type == 'OUTLINER':
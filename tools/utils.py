@@ -1,6 +1,7 @@
 import bpy
 import bmesh
 import os
+import time
 from pathlib import Path
 from typing import List
 from ..myblendrc_utils import utils as myu
@@ -9,6 +10,8 @@ from . import constants as ct
 from ..prefs import get_preferences
 import numpy as np
 from ..myblendrc_utils.common_constants import DataS
+from bpy.app.handlers import persistent
+from ..setup_tools.register import register_other
 
 
 #-------------------------------------------------------------------------------
@@ -19,14 +22,15 @@ def normal_transfer(target_obj:bpy.types.Object, normal_src_obj:bpy.types.Object
     if normal_src_obj is None, then selected vertices will be removed from other normal transfer vertex groups
     """
 
-    selected_v_indices = get_selected_vertex_indices_bmesh(target_obj)
-    if len(selected_v_indices) == 0:
+    if not has_selected_vertices(target_obj):
         print("No vertex is selected.")
         return 1
-
-    remove_from_normal_transfer(target_obj, selected_v_indices)
+    # In edit mode selection is read from the same BMesh which weights are written to. (no edit mesh write-back)
+    selected_v_indices = None if target_obj.mode == 'EDIT' else get_selected_vertex_indices(target_obj)
 
     if normal_src_obj is None: # early out, just remove from exixsting normal transfer modifier.
+        remove_from_normal_transfer(target_obj, selected_v_indices)
+        sync_consolidated_normal_transfer(target_obj)
         return
 
     # Setup Normal Transfer Modifier, reuse existing normal transfer if found.
@@ -56,10 +60,16 @@ def normal_transfer(target_obj:bpy.types.Object, normal_src_obj:bpy.types.Object
     
 
 
-    # Assign to vertex group
-    bpy.ops.object.mode_set(mode='OBJECT')
-    normal_transfer_vg.add(selected_v_indices, 1.0, 'REPLACE')
-    bpy.ops.object.mode_set(mode='EDIT')
+    # Assign to vertex group and remove from other normal transfer vertex groups at once.
+    assign_exclusive_vertex_group(
+        obj=target_obj,
+        v_indices=selected_v_indices,
+        assign_vg=normal_transfer_vg,
+        exclusive_vgs=get_normal_transfer_vertex_groups(target_obj)
+        )
+
+    # rebuild consolidated source so that it follows new vertex group assignment.
+    sync_consolidated_normal_transfer(target_obj)
 
 
     # sync DNT if there is corresponding modifiers
@@ -82,48 +92,6 @@ def get_or_create_vertex_group(obj:bpy.types.Object, name:str)->bpy.types.Vertex
 
 
 
-def get_selected_vertex_indices_bmesh(obj:bpy.types.Object):
-    """
-    Returns a list of indices of selected vertices using bmesh. More efficient for large meshes.
-    Returns an empty list if no mesh object is active or no vertices are selected.
-    """
-    if obj and obj.type == 'MESH':
-        bm = bmesh.from_edit_mesh(obj.data) if bpy.context.object.mode == 'EDIT' else bmesh.new()
-
-        if bpy.context.object.mode == 'OBJECT':
-           bm.from_mesh(obj.data)
-
-        selected_vertices = [v.index for v in bm.verts if v.select]
-
-        if bpy.context.object.mode == 'OBJECT':
-            bm.free() #free bmesh when mode is object.
-
-        return selected_vertices
-    else:
-        return []
-    
-
-def get_selected_edge_indices_bmesh(obj:bpy.types.Object):
-    """
-    Returns a list of indices of selected edges using bmesh. More efficient for large meshes.
-    Returns an empty list if no mesh object is active or no edges are selected.
-    """
-    if obj and obj.type == 'MESH':
-        bm = bmesh.from_edit_mesh(obj.data) if bpy.context.object.mode == 'EDIT' else bmesh.new()
-
-        if bpy.context.object.mode == 'OBJECT':
-           bm.from_mesh(obj.data)
-
-        selected_edges = [e.index for e in bm.edges if e.select]
-
-        if bpy.context.object.mode == 'OBJECT':
-            bm.free() #free bmesh when mode is object.
-
-        return selected_edges
-    else:
-        return []
-
-
 def poll_is_obj_in_part_collection(self, obj):
     """Poll function to filter object, only show when active object exist."""
     active_part_col = getattr(bpy.context.scene, ct.ACTIVE_PART_COLLECTION)
@@ -138,7 +106,7 @@ def poll_is_obj_in_part_collection(self, obj):
     if normal_collection == None:
         return False
     else:
-        return obj.type == 'MESH' and (obj in normal_collection.all_objects[:]) 
+        return obj.type == 'MESH' and (obj.session_uid in PartIndex.get_all_object_uids(normal_collection))
 
 
 
@@ -149,33 +117,441 @@ def poll_is_part_collection(self, col):
 
 
 
-def remove_from_normal_transfer(obj:bpy.types.Object, v_indices:List[int]):
+def remove_from_normal_transfer(obj:bpy.types.Object, v_indices:np.ndarray=None):
     """Remove from Normal Transfer Vertex Group
     This works only for normal tranfer generated by this addon 
     Selected vertex_group will be removed from normal transfer modifier vertex group.
 
     Args:
         obj: Target object. Whose vertices will be modified.
-        v_indices: These vertices will be removed from normal transfer modifier vertex group.
+        v_indices: These vertices will be removed from normal transfer modifier vertex group. If None, selected vertices.
     """
 
+    assign_exclusive_vertex_group(
+        obj=obj,
+        v_indices=v_indices,
+        assign_vg=None,
+        exclusive_vgs=get_normal_transfer_vertex_groups(obj)
+        )
+    return
+
+
+def get_normal_transfer_vertex_groups(obj:bpy.types.Object)->List[bpy.types.VertexGroup]:
+    """Get all vertex groups which are used by normal transfer modifiers generated by this addon.
+    """
     existing_normal_transfer_mods = [m for m in obj.modifiers if m.name.startswith(f"{ct.MD_NORMAL_TRANSFER_NAME}-")]
-    # All vertex groups which are used in normal transfer
-    all_normal_transfer_vgs = []
+    normal_transfer_vgs = []
     for m in existing_normal_transfer_mods:
-        vg_name = m.vertex_group
-        if vg_name != '':
-            all_normal_transfer_vgs.append(vg_name)
+        vg = obj.vertex_groups.get(m.vertex_group)
+        if vg is not None and vg not in normal_transfer_vgs:
+            normal_transfer_vgs.append(vg)
+    return normal_transfer_vgs
+
+
+def assign_exclusive_vertex_group(
+        obj:bpy.types.Object,
+        v_indices:np.ndarray,
+        assign_vg:bpy.types.VertexGroup,
+        exclusive_vgs:List[bpy.types.VertexGroup],
+        weight:float=1.0
+        ):
+    """Assign vertices to one vertex group and remove them from other exclusive vertex groups.
+    In edit mode, weights are written through BMesh deform layer with a per-vertex python loop, so no mode change is needed.
+    In object mode, VertexGroup.add/remove is called once per group.
 
-    bpy.ops.object.mode_set(mode='OBJECT')
-    for vg_name in all_normal_transfer_vgs:
-        vg = obj.vertex_groups.get(vg_name)
-        vg.remove(v_indices)
-    
-    bpy.ops.object.mode_set(mode='EDIT')
+    Args:
+        obj: Target object. Whose vertices will be modified.
+        v_indices: Indices of vertices to modify. If None, selected vertices. In edit mode selection is read in the same BMesh loop.
+        assign_vg: Vertices are assigned to this vertex group. If None, vertices are only removed.
+        exclusive_vgs: Vertices are removed from these vertex groups (assign_vg is ignored).
+        weight: Weight for assign_vg.
+    """
+    assign_index = assign_vg.index if assign_vg is not None else None
+    remove_indices = [vg.index for vg in exclusive_vgs if vg.index != assign_index]
+
+    if obj.mode == 'EDIT':
+        mesh = obj.data
+        bm = bmesh.from_edit_mesh(mesh)
+        deform_layer = bm.verts.layers.deform.verify()
+        if v_indices is None:
+            verts = bm.verts
+        else:
+            bm.verts.ensure_lookup_table()
+            verts = [bm.verts[i] for i in v_indices.tolist()]
+        for v in verts:
+            if v_indices is None and not v.select:
+                continue
+            dvert = v[deform_layer]
+            for group_index in remove_indices:
+                if group_index in dvert:
+                    del dvert[group_index]
+            if assign_index is not None:
+                dvert[assign_index] = weight
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+        return
+
+    if v_indices is None:
+        v_indices = get_selected_vertex_indices(obj)
+    v_index_list = v_indices.tolist()
+    for vg in exclusive_vgs:
+        if vg.index in remove_indices:
+            vg.remove(v_index_list)
+    if assign_vg is not None:
+        assign_vg.add(v_index_list, weight, 'REPLACE')
+    return
+
+
+#-------------------------------------------------------------------------------
+# Normal Transfer Consolidation
+#-------------------------------------------------------------------------------
+def consolidate_normal_transfer(obj:bpy.types.Object):
+    """Replace all MD_NORMAL-* modifiers with a single geometry nodes modifier.
+    Evaluated source objects are merged into one mesh tagged with source index per face, so only one BVH tree is built.
+    Each target vertex carries index of its MD_NORMAL-* vertex group, and Sample Nearest Surface looks up
+    only faces of the same source (Group ID / Sample Group ID). So the result matches the per-source stack.
+    Original modifiers are kept but disabled, so that it can be restored. Modifiers disabled by user are skipped.
+    Merged mesh is a snapshot: edits to source objects are not followed until this is run again.
+
+    Returns:
+        1 if no normal transfer modifier to consolidate, 2 if Blender doesn't support it.
+    """
+    if bpy.app.version < (4, 5, 0): # Set Mesh Normal node
+        print("Normal transfer consolidation needs Blender 4.5 or later.")
+        return 2
+
+    # Keep original visibility of modifiers over consolidations, so that restore doesn't enable modifiers disabled by user.
+    mod_states = obj.get(ct.MD_NORMAL_CONSOLIDATED_MOD_STATES)
+    mod_states = dict(mod_states) if mod_states is not None else {}
+    for m in obj.modifiers:
+        if m.name.startswith(f"{ct.MD_NORMAL_TRANSFER_NAME}-") and m.name not in mod_states:
+            mod_states[m.name] = [m.show_viewport, m.show_render]
+
+    normal_transfer_mods = [
+        m for m in obj.modifiers
+        if m.name.startswith(f"{ct.MD_NORMAL_TRANSFER_NAME}-") and mod_states[m.name][0]
+        and m.object is not None and obj.vertex_groups.get(m.vertex_group) is not None
+        ]
+    if len(normal_transfer_mods) == 0:
+        print(f"No normal transfer modifier to consolidate: '{obj.name}'")
+        return 1
+
+    # Build merged source mesh. Sources are merged in local space because normal transfer doesn't use object transform.
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    merged_mesh = build_consolidated_normal_source_mesh(
+        src_objs=[m.object for m in normal_transfer_mods],
+        depsgraph=depsgraph,
+        name=f"{ct.MD_NORMAL_CONSOLIDATED_NAME}-{obj.name}"
+        )
+
+    # Reuse previously consolidated source object, and replace its mesh.
+    consolidated_mod = obj.modifiers.get(ct.MD_NORMAL_CONSOLIDATED_NAME)
+    consolidated_src_obj = get_dnt_normal_source_object(consolidated_mod)
+    if consolidated_mod is not None and consolidated_mod.type != 'NODES': # consolidated by older version.
+        obj.modifiers.remove(consolidated_mod)
+        consolidated_mod = None
+    if consolidated_src_obj is not None:
+        prev_mesh = consolidated_src_obj.data
+        consolidated_src_obj.data = merged_mesh
+        if prev_mesh.users == 0:
+            bpy.data.meshes.remove(prev_mesh)
+    else:
+        consolidated_src_obj = bpy.data.objects.new(f"{ct.MD_NORMAL_CONSOLIDATED_NAME}-{obj.name}", merged_mesh)
+        setattr(consolidated_src_obj, ct.IS_DNT_NORMAL_OBJECT, True)
+        dnt_collection = PartManager.get_mk_reserved_collection_from_obj(obj, ct.DNT_COLLECTION, fallback=bpy.context.scene.collection)
+        dnt_collection.hide_render = True
+        dnt_collection.hide_viewport = True
+        dnt_collection.objects.link(consolidated_src_obj)
+
+    # Source index of each target vertex follows the order of merged sources.
+    write_normal_source_id_attribute(obj, [obj.vertex_groups.get(m.vertex_group) for m in normal_transfer_mods])
+    legacy_vg = obj.vertex_groups.get(ct.MD_NORMAL_CONSOLIDATED_NAME) # union vertex group used by older version.
+    if legacy_vg is not None:
+        obj.vertex_groups.remove(legacy_vg)
+
+    if consolidated_mod is None:
+        consolidated_mod = obj.modifiers.new(name=ct.MD_NORMAL_CONSOLIDATED_NAME, type='NODES')
+        consolidated_mod.node_group = get_or_create_consolidated_normal_node_group()
+        consolidated_mod.show_in_editmode = True
+        # place where the first normal transfer modifier was, so that following modifiers see the same normals.
+        first_index = min(obj.modifiers.find(m.name) for m in normal_transfer_mods)
+        obj.modifiers.move(len(obj.modifiers) - 1, first_index)
+    set_dnt_normal_source_object(consolidated_mod, consolidated_src_obj)
+    consolidated_mod.show_viewport = True
+    consolidated_mod.show_render = True
+
+    for m in obj.modifiers:
+        if m.name.startswith(f"{ct.MD_NORMAL_TRANSFER_NAME}-"):
+            m.show_viewport = False
+            m.show_render = False
+    obj[ct.MD_NORMAL_CONSOLIDATED_MOD_STATES] = mod_states
+
+    print(f"Consolidated {len(normal_transfer_mods)} normal transfer modifiers: '{obj.name}'")
+    return
+
+
+def restore_normal_transfer(obj:bpy.types.Object):
+    """Remove consolidated modifier, its source object and source index attribute,
+    then restore visibility of MD_NORMAL-* modifiers stored on consolidation.
+    """
+    consolidated_mod = obj.modifiers.get(ct.MD_NORMAL_CONSOLIDATED_NAME)
+    if consolidated_mod is None:
+        print(f"Normal transfer is not consolidated: '{obj.name}'")
+        return 1
+
+    consolidated_src_obj = get_dnt_normal_source_object(consolidated_mod)
+    obj.modifiers.remove(consolidated_mod)
+
+    legacy_vg = obj.vertex_groups.get(ct.MD_NORMAL_CONSOLIDATED_NAME)
+    if legacy_vg is not None:
+        obj.vertex_groups.remove(legacy_vg)
+    remove_normal_source_id_attribute(obj)
+
+    if consolidated_src_obj is not None and getattr(consolidated_src_obj, ct.IS_DNT_NORMAL_OBJECT):
+        merged_mesh = consolidated_src_obj.data
+        bpy.data.objects.remove(consolidated_src_obj)
+        if merged_mesh.users == 0:
+            bpy.data.meshes.remove(merged_mesh)
+
+    mod_states = obj.get(ct.MD_NORMAL_CONSOLIDATED_MOD_STATES)
+    mod_states = dict(mod_states) if mod_states is not None else {}
+    for m in obj.modifiers:
+        if m.name.startswith(f"{ct.MD_NORMAL_TRANSFER_NAME}-"):
+            m.show_viewport, m.show_render = mod_states.get(m.name, [True, True])
+    if ct.MD_NORMAL_CONSOLIDATED_MOD_STATES in obj:
+        del obj[ct.MD_NORMAL_CONSOLIDATED_MOD_STATES]
+    return
 
+
+def is_normal_transfer_consolidated(obj:bpy.types.Object)->bool:
+    return obj.modifiers.get(ct.MD_NORMAL_CONSOLIDATED_NAME) is not None
+
+
+def sync_consolidated_normal_transfer(obj:bpy.types.Object):
+    """Rebuild consolidated source only when object is already consolidated."""
+    if not is_normal_transfer_consolidated(obj):
+        return
+    if consolidate_normal_transfer(obj) == 1: # no normal transfer left.
+        restore_normal_transfer(obj)
+    return
+
+
+def build_consolidated_normal_source_mesh(src_objs:List[bpy.types.Object], depsgraph:bpy.types.Depsgraph, name:str)->bpy.types.Mesh:
+    """Merge evaluated meshes of source objects into new mesh.
+    Custom normals of each source are kept, and index of source object is written to face attribute.
+    """
+    bm = bmesh.new()
+    source_id_layer = bm.faces.layers.int.new(ct.MD_NORMAL_SOURCE_ID_ATTR)
+    corner_normals_list = []
+
+    for source_id, src_obj in enumerate(src_objs):
+        src_obj_eval = src_obj.evaluated_get(depsgraph)
+        src_mesh = src_obj_eval.to_mesh()
+
+        corner_normals = np.empty(len(src_mesh.loops) * 3, dtype=np.float32)
+        src_mesh.corner_normals.foreach_get("vector", corner_normals)
+        corner_normals_list.append(corner_normals)
+
+        face_offset = len(bm.faces)
+        bm.from_mesh(src_mesh) # appends to existing bmesh.
+        bm.faces.ensure_lookup_table()
+        for i in range(face_offset, len(bm.faces)):
+            bm.faces[i][source_id_layer] = source_id
+
+        src_obj_eval.to_mesh_clear()
+
+    merged_mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(merged_mesh)
+    bm.free()
+
+    # corners are written in face order, so concatenated corner normals match merged mesh.
+    merged_mesh.normals_split_custom_set(np.concatenate(corner_normals_list).reshape(-1, 3))
+    return merged_mesh
+
+
+def write_normal_source_id_attribute(obj:bpy.types.Object, vgs:List[bpy.types.VertexGroup]):
+    """Write index of the vertex group each vertex belongs to as point attribute. -1 for vertices in none of them.
+    Index follows order of vgs, which is the order of sources in merged source mesh.
+    """
+    group_to_source_id = {vg.index: i for i, vg in enumerate(vgs)}
+    mesh = obj.data
+
+    if obj.mode == 'EDIT':
+        bm = bmesh.from_edit_mesh(mesh)
+        deform_layer = bm.verts.layers.deform.verify()
+        source_id_layer = bm.verts.layers.int.get(ct.MD_NORMAL_SOURCE_ID_ATTR) or bm.verts.layers.int.new(ct.MD_NORMAL_SOURCE_ID_ATTR)
+        for v in bm.verts:
+            dvert = v[deform_layer]
+            v[source_id_layer] = next((group_to_source_id[g] for g, w in dvert.items() if w > 0.0 and g in group_to_source_id), -1)
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+        return
+
+    source_ids = np.full(len(mesh.vertices), -1, dtype=np.int32)
+    for v in mesh.vertices:
+        for g in v.groups:
+            if g.weight > 0.0 and g.group in group_to_source_id:
+                source_ids[v.index] = group_to_source_id[g.group]
+                break
+
+    attr = mesh.attributes.get(ct.MD_NORMAL_SOURCE_ID_ATTR)
+    if attr is not None and (attr.domain != 'POINT' or attr.data_type != 'INT'):
+        mesh.attributes.remove(attr)
+        attr = None
+    if attr is None:
+        attr = mesh.attributes.new(name=ct.MD_NORMAL_SOURCE_ID_ATTR, type='INT', domain='POINT')
+    attr.data.foreach_set("value", source_ids)
+    mesh.update()
     return
 
+
+def remove_normal_source_id_attribute(obj:bpy.types.Object):
+    mesh = obj.data
+    if obj.mode == 'EDIT':
+        bm = bmesh.from_edit_mesh(mesh)
+        source_id_layer = bm.verts.layers.int.get(ct.MD_NORMAL_SOURCE_ID_ATTR)
+        if source_id_layer is not None:
+            bm.verts.layers.int.remove(source_id_layer)
+            bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+        return
+
+    attr = mesh.attributes.get(ct.MD_NORMAL_SOURCE_ID_ATTR)
+    if attr is not None:
+        mesh.attributes.remove(attr)
+    return
+
+
+def get_or_create_consolidated_normal_node_group()->bpy.types.GeometryNodeTree:
+    """Get geometry nodes group for consolidated normal transfer. If not found, build it.
+    Corner normal of merged 'Source' is sampled at nearest surface point among faces whose source index equals
+    source index of target vertex. Vertices without source (-1) find no face and keep their own normal.
+    """
+    node_group = bpy.data.node_groups.get(ct.MD_NORMAL_CONSOLIDATED_NODE_GROUP_NAME)
+    if node_group is not None and node_group.bl_idname == 'GeometryNodeTree':
+        return node_group
+
+    node_group = bpy.data.node_groups.new(name=ct.MD_NORMAL_CONSOLIDATED_NODE_GROUP_NAME, type='GeometryNodeTree')
+    node_group.is_modifier = True
+
+    interface = node_group.interface
+    interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    interface.new_socket(name=ct.DNT_NORMAL_NODE_GROUP_SOURCE_INPUT, in_out='INPUT', socket_type='NodeSocketObject') # same name, so DNT source helpers work.
+    interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = node_group.nodes
+    links = node_group.links
+
+    group_input = nodes.new("NodeGroupInput")
+    group_input.location = (-1000, 0)
+
+    object_info = nodes.new("GeometryNodeObjectInfo")
+    object_info.transform_space = 'ORIGINAL'
+    object_info.location = (-800, -200)
+
+    source_normal = nodes.new("GeometryNodeInputNormal")
+    source_normal.location = (-1000, -400)
+
+    corner_normal = nodes.new("GeometryNodeFieldOnDomain")
+    corner_normal.data_type = 'FLOAT_VECTOR'
+    corner_normal.domain = 'CORNER'
+    corner_normal.location = (-800, -400)
+
+    source_id = nodes.new("GeometryNodeInputNamedAttribute") # evaluated on merged source faces.
+    source_id.data_type = 'INT'
+    source_id.inputs["Name"].default_value = ct.MD_NORMAL_SOURCE_ID_ATTR
+    source_id.location = (-800, -550)
+
+    target_source_id = nodes.new("GeometryNodeInputNamedAttribute") # evaluated on target.
+    target_source_id.data_type = 'INT'
+    target_source_id.inputs["Name"].default_value = ct.MD_NORMAL_SOURCE_ID_ATTR
+    target_source_id.location = (-800, -700)
+
+    sample_nearest = nodes.new("GeometryNodeSampleNearestSurface")
+    sample_nearest.data_type = 'FLOAT_VECTOR'
+    sample_nearest.location = (-600, -200)
+
+    normalize = nodes.new("ShaderNodeVectorMath")
+    normalize.operation = 'NORMALIZE'
+    normalize.location = (-400, -200)
+
+    own_normal = nodes.new("GeometryNodeInputNormal")
+    own_normal.location = (-400, -400)
+
+    switch = nodes.new("GeometryNodeSwitch")
+    switch.input_type = 'VECTOR'
+    switch.location = (-200, -200)
+
+    set_normal = nodes.new("GeometryNodeSetMeshNormal")
+    set_normal.mode = 'FREE'
+    set_normal.domain = 'CORNER'
+    set_normal.location = (0, 0)
+
+    group_output = nodes.new("NodeGroupOutput")
+    group_output.location = (200, 0)
+
+    links.new(group_input.outputs[ct.DNT_NORMAL_NODE_GROUP_SOURCE_INPUT], object_info.inputs["Object"])
+    links.new(object_info.outputs["Geometry"], sample_nearest.inputs["Mesh"])
+    links.new(source_normal.outputs["Normal"], corner_normal.inputs[0])
+    links.new(corner_normal.outputs[0], sample_nearest.inputs["Value"])
+    links.new(source_id.outputs["Attribute"], sample_nearest.inputs["Group ID"])
+    links.new(target_source_id.outputs["Attribute"], sample_nearest.inputs["Sample Group ID"])
+    links.new(sample_nearest.outputs["Value"], normalize.inputs[0])
+    links.new(sample_nearest.outputs["Is Valid"], switch.inputs["Switch"])
+    links.new(own_normal.outputs["Normal"], switch.inputs["False"])
+    links.new(normalize.outputs["Vector"], switch.inputs["True"])
+    links.new(group_input.outputs["Geometry"], set_normal.inputs["Mesh"])
+    links.new(switch.outputs["Output"], set_normal.inputs["Custom Normal"])
+    links.new(set_normal.outputs["Mesh"], group_output.inputs["Geometry"])
+
+    return node_group
+
+
+#-------------------------------------------------------------------------------
+# Selection Query
+#-------------------------------------------------------------------------------
+def get_selected_vertex_indices(obj:bpy.types.Object)->np.ndarray:
+    """Returns indices of selected vertices as numpy int32 array.
+    Returns an empty array if object is not mesh or no vertices are selected.
+    """
+    return _get_selected_indices(obj, '.select_vert')
+
+
+def has_selected_vertices(obj:bpy.types.Object)->bool:
+    """Check if any vertex is selected.
+    total_vert_sel is edit mode selection count (0 outside edit mode), so object mode reads '.select_vert' attribute.
+    """
+    if obj is None or obj.type != 'MESH':
+        return False
+    if obj.mode == 'EDIT':
+        return obj.data.total_vert_sel > 0
+    return len(get_selected_vertex_indices(obj)) > 0
+
+
+def _get_selected_indices(obj:bpy.types.Object, select_attr_name:str)->np.ndarray:
+    """Read selection attribute with foreach_get and return selected indices.
+    In edit mode, obj.update_from_editmode() is called first. This is a full write-back of edit mesh
+    to mesh data (cost grows with mesh size), not a cheap query. It avoids mode change only.
+
+    Args:
+        select_attr_name: '.select_vert', '.select_edge' or '.select_poly'
+    """
+    empty_indices = np.empty(0, dtype=np.int32)
+    if obj is None or obj.type != 'MESH':
+        return empty_indices
+
+    mesh = obj.data
+    if obj.mode == 'EDIT':
+        if mesh.total_vert_sel == 0: # nothing is selected. skip writing back edit mesh.
+            return empty_indices
+        obj.update_from_editmode()
+
+    select_attribute = mesh.attributes.get(select_attr_name)
+    if select_attribute is None: # attribute does not exist when nothing is selected.
+        return empty_indices
+
+    selection = np.zeros(len(select_attribute.data), dtype=bool)
+    select_attribute.data.foreach_get("value", selection)
+    return np.flatnonzero(selection).astype(np.int32)
+
+
 #-------------------------------------------------------------------------------
 # Separate As Normal Transfer
 #-------------------------------------------------------------------------------
@@ -184,7 +560,7 @@ def separate_as_normal_source_object(name:str, assign_as_src:bool=True, shade_sm
     if there is DNT bevel and normal transfer modifier, then it will be removed.
     """
     active_obj = bpy.context.active_object
-    if len(get_selected_vertex_indices_bmesh(active_obj)) == 0:
+    if not has_selected_vertices(active_obj):
         print("No vertex is selected.")
         return 1
     
@@ -261,36 +637,74 @@ def set_edge_bevel_weight_with_sharp(weight:float, modify_sharp:bool=True):
 #-------------------------------------------------------------------------------
 # Set Modifier Bevel Width
 #-------------------------------------------------------------------------------
-def set_dnt_bevel_modifier_width(modifier_width:float, keep_visual_width:bool, orig_width:float):
+def set_dnt_bevel_modifier_width(modifier_width:float, keep_visual_width:bool, orig_widths:dict):
     """Set DNT bevel modifier width with keep visual width option.
+    Works on all selected objects with DNT bevel modifier. No mode change is required,
+    in edit mode bevel weights are modified through BMesh float layer.
+
     Args:
         modifier_width: This value is set as bevel modifier 'Amount' paramete.
         keep_visual_width: If true, it tries to keep visual width of the bevel.
-        orig_width: This is necessary in edit mode. It stores original modifier width through out 'Adjust last operation'.
+        orig_widths: {object name: width}. This is necessary in edit mode. It stores original modifier width through out 'Adjust last operation'.
     """
-    obj = bpy.context.active_object
-    mesh = obj.data
-    orig_mode = obj.mode
-    bpy.ops.object.mode_set(mode='OBJECT')
+    for obj in get_dnt_bevel_objects(bpy.context):
+        dnt_bevel_mod = obj.modifiers.get(ct.DNT_BEVEL_NAME)
+        old_width = orig_widths.get(obj.name, dnt_bevel_mod.width)
 
-    dnt_bevel_mod = obj.modifiers.get(ct.DNT_BEVEL_NAME)
-    old_width = orig_width
+        if keep_visual_width == True and modifier_width > 0.0: # zero division guard
+            scale_edge_bevel_weight(obj, old_width/modifier_width)
 
-    if keep_visual_width == True and modifier_width > 0.0: # zero division guard
-        # get edge bevel weight attribute
-        edge_bevel_weight_attribute = mesh.attributes.get('bevel_weight_edge')
-        if edge_bevel_weight_attribute is None:
-            edge_bevel_weight_attribute = mesh.attributes.new(name="bevel_weight_edge", type="FLOAT", domain="EDGE")
+        dnt_bevel_mod.width = modifier_width
 
-        edge_bevel_weights = np.full(len(obj.data.edges), 0.0)
-        edge_bevel_weight_attribute.data.foreach_get("value", edge_bevel_weights)
-        edge_bevel_weights = old_width/modifier_width * edge_bevel_weights
-        edge_bevel_weight_attribute.data.foreach_set("value", edge_bevel_weights)
-        
-    dnt_bevel_mod.width = modifier_width
+    return
 
-    bpy.ops.object.mode_set(mode=orig_mode)
 
+def get_dnt_bevel_objects(context:bpy.types.Context)->List[bpy.types.Object]:
+    """Get selected mesh objects and active object which have DNT bevel modifier.
+    """
+    objs = list(context.selected_objects)
+    if context.active_object is not None and context.active_object not in objs:
+        objs.append(context.active_object)
+
+    return [o for o in objs if o.type == 'MESH' and o.modifiers.get(ct.DNT_BEVEL_NAME) is not None]
+
+
+_edge_bevel_weight_buffer = np.empty(0, dtype=np.float32) # reused for foreach_get/foreach_set of bevel_weight_edge.
+
+def _get_edge_bevel_weight_buffer(size:int)->np.ndarray:
+    """Get float32 buffer view with given size. Buffer is grown only when it is too small."""
+    global _edge_bevel_weight_buffer
+    if len(_edge_bevel_weight_buffer) < size:
+        _edge_bevel_weight_buffer = np.empty(size, dtype=np.float32)
+    return _edge_bevel_weight_buffer[:size]
+
+
+def scale_edge_bevel_weight(obj:bpy.types.Object, factor:float):
+    """Multiply edge bevel weight of given object.
+    In edit mode, BMesh float layer is modified directly. In object mode, attribute is modified
+    with foreach_get/foreach_set on reused float32 buffer (same type with attribute, no conversion).
+    """
+    mesh = obj.data
+
+    if obj.mode == 'EDIT':
+        bm = bmesh.from_edit_mesh(mesh)
+        bevel_weight_layer = bm.edges.layers.float.get('bevel_weight_edge')
+        if bevel_weight_layer is None: # no weight, nothing to scale.
+            return
+        for e in bm.edges:
+            e[bevel_weight_layer] *= factor
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+        return
+
+    edge_bevel_weight_attribute = mesh.attributes.get('bevel_weight_edge')
+    if edge_bevel_weight_attribute is None:
+        return
+
+    edge_bevel_weights = _get_edge_bevel_weight_buffer(len(mesh.edges))
+    edge_bevel_weight_attribute.data.foreach_get("value", edge_bevel_weights)
+    edge_bevel_weights *= factor
+    edge_bevel_weight_attribute.data.foreach_set("value", edge_bevel_weights)
+    mesh.update()
     return
 
 
@@ -337,13 +751,23 @@ def face_strength_material_override_update(self, context):
     print(f"face_strength_material_override_update called, value: {getattr(self, ct.IS_MD_FACE_STRENGTH_MATERIAL_OVERRIDE)}")
 
     fs_mat_manager = FaceStrengthMaterialOverrideManager()
-    fs_mat_manager.initialize_material() # you have to check everytime to initialize.
-    
+    prefs = get_preferences()
     if current_face_strength_visibility == True:
-        fs_mat_manager.setup()
+        if fs_mat_manager.initialize_material() == 1: # cached, library is read only when not loaded in this file.
+            print("Face strength material override is not applied.")
+            return
+        if prefs.face_strength_backend == 'VIEW_LAYER':
+            fs_mat_manager.setup_view_layers(self)
+        elif prefs.face_strength_visible_only:
+            fs_mat_manager.setup_visible(context.evaluated_depsgraph_get())
+        else:
+            fs_mat_manager.setup()
     
-    else:
-        fs_mat_manager.restore()
+    else: # restore both, backend might be changed while override is on.
+        fs_mat_manager.restore_view_layers(self)
+        # node restore walks bpy.data when registry is invalidated. Skip it when view layer backend is used.
+        if fs_mat_manager.is_applied or (prefs.face_strength_backend == 'NODE_INJECTION' and fs_mat_manager.has_node_patches()):
+            fs_mat_manager.restore()
     
     return
 
@@ -356,50 +780,268 @@ class FaceStrengthMaterialOverrideManager:
         Face strength materials will be generated.
     For objects which have materials:
         For each existing material, material output node will be newlly generated and temprarilly make active.
+
+    Managed meshes and materials are kept in registry across toggles, so setup and restore touch only them
+    and bpy.data is walked only once after file load or undo.
     """
     face_strength_material:bpy.types.Material = None
     face_strength_node_tree:bpy.types.ShaderNodeTree = None
+    managed_materials:dict = {} # session_uid -> material which face strength nodes are injected to while override is on.
+    managed_meshes:dict = {} # session_uid -> local mesh without material, face strength material is appended while override is on.
+    is_registry_valid:bool = False # registry ID references are safe and registry contains every patched ID.
+    is_coverage_complete:bool = False # registry contains every eligible ID in bpy.data. Kept up to date by depsgraph handler.
+    is_applied:bool = False # managed IDs are currently patched.
     
     @classmethod
     def initialize_material(cls):
         """import face strength material and node tree if not exist in current file.
+        Both are fetched in one library load, and cached references are reused while they match bpy.data.
+        Returns:
+            1 if material or node tree is not found in library.
         """
-        cls.face_strength_material = bpy.data.materials.get(ct.FACE_STRENGTH_MAT_NAME)
-        if cls.face_strength_material == None:
-            cls.face_strength_material = myu.load_from_lib_and_return(ct.FACE_STRENGTH_MATERIAL_BLEND_PATH, 'materials', ct.FACE_STRENGTH_MAT_NAME, link=True)
-
-        cls.face_strength_node_tree = bpy.data.node_groups.get(ct.FACE_STRENGTH_MAT_NAME)
-        if cls.face_strength_node_tree == None:
-            cls.face_strength_node_tree = myu.load_from_lib_and_return(ct.FACE_STRENGTH_MATERIAL_BLEND_PATH, 'node_groups', ct.FACE_STRENGTH_MAT_NAME, link=True)
+        if cls._is_library_cache_valid():
+            return
 
+        mat = bpy.data.materials.get(ct.FACE_STRENGTH_MAT_NAME)
+        node_tree = bpy.data.node_groups.get(ct.FACE_STRENGTH_MAT_NAME)
+        if mat is None or node_tree is None:
+            with bpy.data.libraries.load(ct.FACE_STRENGTH_MATERIAL_BLEND_PATH, link=True) as (data_from, data_to):
+                if mat is None:
+                    data_to.materials = [ct.FACE_STRENGTH_MAT_NAME]
+                if node_tree is None:
+                    data_to.node_groups = [ct.FACE_STRENGTH_MAT_NAME]
+            if mat is None:
+                mat = data_to.materials[0]
+            if node_tree is None:
+                node_tree = data_to.node_groups[0]
+            if mat is None or node_tree is None:
+                print(f"Face strength material not found in '{ct.FACE_STRENGTH_MATERIAL_BLEND_PATH}'")
+                return 1
+
+        cls.face_strength_material = mat
+        cls.face_strength_node_tree = node_tree
         return
 
-    
+
+    @classmethod
+    def _is_library_cache_valid(cls)->bool:
+        if cls.face_strength_material is None or cls.face_strength_node_tree is None:
+            return False
+        try:
+            return (cls.face_strength_material == bpy.data.materials.get(ct.FACE_STRENGTH_MAT_NAME)
+                    and cls.face_strength_node_tree == bpy.data.node_groups.get(ct.FACE_STRENGTH_MAT_NAME))
+        except ReferenceError: # freed by undo or removed by user.
+            return False
+
+
+    @classmethod
+    def reset_library_cache(cls):
+        cls.face_strength_material = None
+        cls.face_strength_node_tree = None
+
+
     @classmethod
     def setup(cls):
-        all_mesh_obj = [o for o in bpy.data.objects if o.type == 'MESH']
-        for obj in all_mesh_obj:
-            if len(obj.data.materials) == 0:
-                obj.data.materials.append(material=cls.face_strength_material)
+        """Patch every eligible mesh and material. bpy.data is walked only when registry doesn't cover it yet,
+        otherwise only registered IDs are patched.
+        """
+        cls._ensure_registry()
+        if not cls.is_coverage_complete:
+            for obj in bpy.data.objects:
+                if obj.type == 'MESH':
+                    cls._register_object(obj)
+            for m in bpy.data.materials:
+                cls._register_material(m)
+            cls.is_coverage_complete = True
+
+        for mesh_uid, mesh in list(cls.managed_meshes.items()):
+            try:
+                cls._setup_mesh(mesh)
+            except ReferenceError: # removed.
+                del cls.managed_meshes[mesh_uid]
+        for mat_uid, mat in list(cls.managed_materials.items()):
+            try:
+                cls._setup_material(mat)
+            except ReferenceError:
+                del cls.managed_materials[mat_uid]
+        cls.is_applied = True
+
+
+    @classmethod
+    def setup_view_layers(cls, scene:bpy.types.Scene):
+        """Use face strength material as material override of every view layer in scene.
+        Cost doesn't depend on material count, and materials are never modified.
+        Previous override is stored on view layer, so it survives undo, file switch and save.
+        """
+        for view_layer in scene.view_layers:
+            if cls._is_face_strength_override(view_layer):
+                continue
+            setattr(view_layer, ct.FACE_STRENGTH_PREV_MATERIAL_OVERRIDE, view_layer.material_override)
+            view_layer.material_override = cls.face_strength_material
 
-        for m in bpy.data.materials:
-            if not m.is_grease_pencil:
-                cls._setup_node(m)
+
+    @classmethod
+    def restore_view_layers(cls, scene:bpy.types.Scene):
+        for view_layer in scene.view_layers:
+            if not cls._is_face_strength_override(view_layer):
+                continue
+            view_layer.material_override = getattr(view_layer, ct.FACE_STRENGTH_PREV_MATERIAL_OVERRIDE)
+            setattr(view_layer, ct.FACE_STRENGTH_PREV_MATERIAL_OVERRIDE, None)
+
+
+    @classmethod
+    def _is_face_strength_override(cls, view_layer:bpy.types.ViewLayer)->bool:
+        """Compare by name, cached material reference might belong to previous undo step."""
+        return view_layer.material_override is not None and view_layer.material_override.name == ct.FACE_STRENGTH_MAT_NAME
+
+
+    @classmethod
+    def setup_updated(cls, depsgraph:bpy.types.Depsgraph, visible_only:bool=False):
+        """Patch only materials and mesh objects reported by depsgraph. Used while override is on."""
+        if cls.initialize_material() == 1:
+            return
+        cls._ensure_registry()
+        for update in depsgraph.updates:
+            id_orig = update.id.original
+            if isinstance(id_orig, bpy.types.Material):
+                cls._register_material(id_orig)
+                if id_orig.session_uid in cls.managed_materials:
+                    cls._setup_material(id_orig)
+            elif isinstance(id_orig, bpy.types.Object) and id_orig.type == 'MESH':
+                if visible_only and not id_orig.visible_get(view_layer=depsgraph.view_layer):
+                    continue
+                cls._setup_object(id_orig)
+
+
+    @classmethod
+    def register_updated(cls, depsgraph:bpy.types.Depsgraph):
+        """Register materials and mesh objects reported by depsgraph without patching. Used while override is off,
+        so that registry keeps covering bpy.data and next setup doesn't need to walk it.
+        """
+        if not (cls.is_registry_valid and cls.is_coverage_complete):
+            return
+        for update in depsgraph.updates:
+            id_orig = update.id.original
+            if isinstance(id_orig, bpy.types.Material):
+                cls._register_material(id_orig)
+            elif isinstance(id_orig, bpy.types.Object) and id_orig.type == 'MESH':
+                cls._register_object(id_orig)
+
+
+    @classmethod
+    def setup_visible(cls, depsgraph:bpy.types.Depsgraph):
+        """Patch only meshes and materials used by visible objects in depsgraph view layer.
+        Used by visible only mode, so cost follows what is on screen.
+        """
+        if cls.initialize_material() == 1:
+            return
+        cls._ensure_registry()
+        view_layer = depsgraph.view_layer
+        for obj_eval in depsgraph.objects:
+            obj = obj_eval.original
+            if obj.type == 'MESH' and obj.visible_get(view_layer=view_layer):
+                cls._setup_object(obj)
+        cls.is_applied = True
 
 
     @classmethod
     def restore(cls):
-        all_mesh_obj = [o for o in bpy.data.objects if o.type == 'MESH'] # you have to check each time for removal of object etc. Might be changed.
-        for obj in all_mesh_obj:
-            generated_mat = obj.data.materials.get(cls.face_strength_material.name)
-            if generated_mat is not None:
-                obj.data.materials.pop(index=obj.material_slots[cls.face_strength_material.name].slot_index)
-                if len(obj.data.materials) == 0 and len(obj.material_slots) == 1: # pop leaves empty slot. Clean up.
-                    obj.data.materials.clear()
+        """Revert registered meshes and materials. Registry is kept for next setup."""
+        cls._ensure_registry()
+        for mesh_uid, mesh in list(cls.managed_meshes.items()):
+            try:
+                cls._restore_mesh(mesh)
+            except ReferenceError: # removed while override is on.
+                del cls.managed_meshes[mesh_uid]
+
+        for mat_uid, mat in list(cls.managed_materials.items()):
+            try:
+                cls._restore_node(mat)
+            except ReferenceError:
+                del cls.managed_materials[mat_uid]
+        cls.is_applied = False
+
 
+    @classmethod
+    def has_node_patches(cls)->bool:
+        """True if patches may exist. Unknown (registry invalidated) is treated as True."""
+        return (not cls.is_registry_valid) or cls.is_applied
+
+
+    @classmethod
+    def invalidate_registry(cls):
+        """Registry holds ID references, which are not safe to keep over undo or file load."""
+        cls.managed_meshes = {}
+        cls.managed_materials = {}
+        cls.is_registry_valid = False
+        cls.is_coverage_complete = False
+        cls.is_applied = False
+
+
+    @classmethod
+    def _ensure_registry(cls):
+        """Rebuild registry from named nodes and generated material slots after invalidation."""
+        if cls.is_registry_valid:
+            return
         for m in bpy.data.materials:
-            if not m.is_grease_pencil:
-                cls._restore_node(m)
+            if m.node_tree is not None and m.node_tree.nodes.get(ct.FACE_STRENGTH_MAT_NAME) is not None:
+                cls.managed_materials[m.session_uid] = m
+        for mesh in bpy.data.meshes:
+            if mesh.library is None and mesh.materials.find(ct.FACE_STRENGTH_MAT_NAME) != -1:
+                cls.managed_meshes[mesh.session_uid] = mesh
+        cls.is_applied = len(cls.managed_materials) + len(cls.managed_meshes) > 0
+        cls.is_registry_valid = True
+
+
+    @classmethod
+    def _register_object(cls, obj:bpy.types.Object):
+        mesh = obj.data
+        if mesh.library is None and len(mesh.materials) == 0:
+            cls.managed_meshes[mesh.session_uid] = mesh
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                cls._register_material(slot.material)
+
+
+    @classmethod
+    def _register_material(cls, mat:bpy.types.Material):
+        if mat.library is not None or mat.is_grease_pencil or mat.node_tree is None or mat.name == ct.FACE_STRENGTH_MAT_NAME:
+            return
+        cls.managed_materials[mat.session_uid] = mat
+
+
+    @classmethod
+    def _setup_object(cls, obj:bpy.types.Object):
+        cls._register_object(obj)
+        if obj.data.session_uid in cls.managed_meshes:
+            cls._setup_mesh(obj.data)
+        for slot in obj.material_slots:
+            if slot.material is not None and slot.material.session_uid in cls.managed_materials:
+                cls._setup_material(slot.material)
+
+
+    @classmethod
+    def _setup_mesh(cls, mesh:bpy.types.Mesh):
+        if len(mesh.materials) != 0: # already patched, or material is assigned by user.
+            return
+        mesh.materials.append(material=cls.face_strength_material)
+
+
+    @classmethod
+    def _restore_mesh(cls, mesh:bpy.types.Mesh):
+        mat_index = mesh.materials.find(ct.FACE_STRENGTH_MAT_NAME)
+        if mat_index == -1:
+            return
+        mesh.materials.pop(index=mat_index)
+        if all(m is None for m in mesh.materials): # pop leaves empty slot. Clean up.
+            mesh.materials.clear()
+
+
+    @classmethod
+    def _setup_material(cls, mat:bpy.types.Material):
+        if mat.node_tree.nodes.get(ct.FACE_STRENGTH_MAT_NAME) is not None: # already patched.
+            return
+        cls._setup_node(mat)
 
 
     @classmethod
@@ -439,119 +1081,934 @@ class FaceStrengthMaterialOverrideManager:
         return
 
 
+@persistent
+def face_strength_override_on_depsgraph_update(scene, depsgraph):
+    """Patch materials and objects added while face strength override is on."""
+    prefs = get_preferences()
+    if prefs.face_strength_backend != 'NODE_INJECTION':
+        return
+    if not getattr(scene, ct.IS_MD_FACE_STRENGTH_MATERIAL_OVERRIDE):
+        # keep registry covering bpy.data, so that next toggle doesn't walk it.
+        if depsgraph.id_type_updated('MATERIAL') or depsgraph.id_type_updated('OBJECT'):
+            FaceStrengthMaterialOverrideManager.register_updated(depsgraph)
+        return
+
+    # visibility of collections changed, extend coverage to newly visible objects.
+    # SCENE updates (selection, frame change...) are ignored. LayerCollection changes are handled by msgbus.
+    if prefs.face_strength_visible_only and depsgraph.id_type_updated('COLLECTION'):
+        FaceStrengthMaterialOverrideManager.setup_visible(depsgraph)
+        return
+
+    if not (depsgraph.id_type_updated('MATERIAL') or depsgraph.id_type_updated('OBJECT')):
+        return
+    FaceStrengthMaterialOverrideManager.setup_updated(depsgraph, visible_only=prefs.face_strength_visible_only)
+
+
+FACE_STRENGTH_VISIBILITY_MSGBUS_KEYS = [
+    (bpy.types.LayerCollection, 'exclude'),
+    (bpy.types.LayerCollection, 'hide_viewport'),
+]
+
+face_strength_visibility_msgbus_owner = object()
+
+
+def face_strength_override_on_layer_collection_visibility(*args):
+    """LayerCollection visibility changed, patch newly visible objects in visible only mode."""
+    context = bpy.context
+    if not getattr(context.scene, ct.IS_MD_FACE_STRENGTH_MATERIAL_OVERRIDE):
+        return
+    prefs = get_preferences()
+    if prefs.face_strength_backend != 'NODE_INJECTION' or not prefs.face_strength_visible_only:
+        return
+    FaceStrengthMaterialOverrideManager.setup_visible(context.evaluated_depsgraph_get())
+
+
+def subscribe_face_strength_visibility():
+    for key in FACE_STRENGTH_VISIBILITY_MSGBUS_KEYS:
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=face_strength_visibility_msgbus_owner,
+            args=(),
+            notify=face_strength_override_on_layer_collection_visibility
+            )
+
+def unsubscribe_face_strength_visibility():
+    bpy.msgbus.clear_by_owner(face_strength_visibility_msgbus_owner)
+
+
+@persistent
+def resubscribe_face_strength_visibility_on_load(dummy):
+    """msgbus subscriptions are cleared when file is loaded."""
+    unsubscribe_face_strength_visibility()
+    subscribe_face_strength_visibility()
+
+
+@persistent
+def invalidate_face_strength_registry(dummy):
+    FaceStrengthMaterialOverrideManager.invalidate_registry()
+
+
+@persistent
+def reset_face_strength_library_cache(dummy):
+    """Cached library datablocks belong to previous file or undo step."""
+    FaceStrengthMaterialOverrideManager.reset_library_cache()
+
+
+def register_face_strength_override_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(face_strength_override_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(reset_face_strength_library_cache)
+    bpy.app.handlers.load_post.append(invalidate_face_strength_registry)
+    bpy.app.handlers.undo_post.append(invalidate_face_strength_registry)
+    bpy.app.handlers.redo_post.append(invalidate_face_strength_registry)
+    bpy.app.handlers.undo_post.append(reset_face_strength_library_cache)
+    bpy.app.handlers.redo_post.append(reset_face_strength_library_cache)
+    bpy.app.handlers.load_post.append(resubscribe_face_strength_visibility_on_load)
+    subscribe_face_strength_visibility()
+
+def unregister_face_strength_override_handlers():
+    unsubscribe_face_strength_visibility()
+    handlers = [
+        (bpy.app.handlers.load_post, resubscribe_face_strength_visibility_on_load),
+        (bpy.app.handlers.depsgraph_update_post, face_strength_override_on_depsgraph_update),
+        (bpy.app.handlers.load_post, reset_face_strength_library_cache),
+        (bpy.app.handlers.load_post, invalidate_face_strength_registry),
+        (bpy.app.handlers.undo_post, invalidate_face_strength_registry),
+        (bpy.app.handlers.redo_post, invalidate_face_strength_registry),
+        (bpy.app.handlers.undo_post, reset_face_strength_library_cache),
+        (bpy.app.handlers.redo_post, reset_face_strength_library_cache),
+    ]
+    for handler_list, func in handlers:
+        if func in handler_list:
+            handler_list.remove(func)
+
+register_other(
+    register_func=register_face_strength_override_handlers,
+    unregister_func=unregister_face_strength_override_handlers)
+
+
+#-------------------------------------------------------------------------------
+# Sync DNT
+#-------------------------------------------------------------------------------
+def sync_dnt():
+    """Setup and sync DNT
+    """
+    context = bpy.context
+    obj = context.active_object
+        
+    
+    # TODO may be a better way
+    orig_mode = obj.mode
+    bpy.ops.object.mode_set(mode='OBJECT')
+    myu.select_only(obj)
+    bpy.ops.object.shade_smooth()
+    bpy.ops.object.mode_set(mode=orig_mode)
+    
+    # Setup bevel and data transfer modifiers
+    modifier_names = [m.name for m in obj.modifiers]
+    prefs = get_preferences()
+
+    if ct.DNT_WEIGHTED_NORMAL_NAME not in modifier_names:
+        mod_w_norm = obj.modifiers.new(name=ct.DNT_WEIGHTED_NORMAL_NAME, type="WEIGHTED_NORMAL")
+        mod_w_norm.mode = 'CORNER_ANGLE'
+        mod_w_norm.keep_sharp = True
+        mod_w_norm.use_face_influence = True
+        mod_w_norm.show_in_editmode = True
+
+
+    # Reuse DNT normal modifier only when it matches current backend. Otherwise, replace it.
+    backend = get_dnt_backend()
+    mod_dnt_nromal = obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME)
+    prev_normal_ref_obj = get_dnt_normal_source_object(mod_dnt_nromal)
+    if mod_dnt_nromal is not None and mod_dnt_nromal.type != DNT_BACKEND_MODIFIER_TYPE[backend]:
+        obj.modifiers.remove(mod_dnt_nromal)
+        mod_dnt_nromal = None
+
+    if mod_dnt_nromal is None:
+        mod_dnt_nromal = new_dnt_normal_modifier(obj, backend)
+
+    if ct.DNT_BEVEL_NAME not in modifier_names:
+        mod_dnt_bevel = obj.modifiers.new(name=ct.DNT_BEVEL_NAME, type="BEVEL")
+
+        mod_dnt_bevel.limit_method = 'WEIGHT'
+        mod_dnt_bevel.offset_type = prefs.default_bevel_width_type
+        mod_dnt_bevel.width = prefs.default_bevel_width
+        mod_dnt_bevel.loop_slide = False
+        mod_dnt_bevel.use_clamp_overlap = False
+        mod_dnt_bevel.show_in_editmode = True
+
+    else:
+        mod_dnt_bevel = obj.modifiers.get(ct.DNT_BEVEL_NAME)
+
+    
+    # by toggling False -> True, you can ensure the use_pin_to_last order
+    mod_dnt_nromal.use_pin_to_last = False
+    mod_dnt_bevel.use_pin_to_last = False
+
+    mod_dnt_nromal.use_pin_to_last = True
+    mod_dnt_bevel.use_pin_to_last = True
+
+
+
+    # Generate collection to store generated DNT normal source object.
+    dnt_collection = PartManager.get_mk_reserved_collection_from_obj(obj, ct.DNT_COLLECTION, fallback=bpy.context.scene.collection)
+    dnt_collection.hide_render = True
+    dnt_collection.hide_viewport = True
+
+    # remove previously created DNT normal source object
+    if prev_normal_ref_obj is not None:
+        bpy.data.objects.remove(prev_normal_ref_obj)
+
+    # create normal transfer source object.
+    normal_ref_obj = obj.copy()
+    normal_ref_obj.name = f"{ct.DNT_NORMAL_TRANSFER_NAME}-{obj.name}"
+    setattr(normal_ref_obj, ct.IS_DNT_NORMAL_OBJECT, True)
+    clean_up_dnt_modifiers(normal_ref_obj)
+    dnt_collection.objects.link(normal_ref_obj)
+
+
+    # setup data transfer modifier rerference object
+    set_dnt_normal_source_object(mod_dnt_nromal, normal_ref_obj)
+    return
+
+
+DNT_BACKEND_MODIFIER_TYPE = {
+    'DATA_TRANSFER': 'DATA_TRANSFER',
+    'GEOMETRY_NODES': 'NODES',
+}
+
+
+def get_dnt_backend()->str:
+    """Get DNT backend from preferences.
+    Geometry nodes backend needs 'Set Mesh Normal' node, so it falls back to DATA_TRANSFER on older Blender.
+    """
+    backend = get_preferences().dnt_backend
+    if backend == 'GEOMETRY_NODES' and bpy.app.version < (4, 5, 0):
+        print("Geometry Nodes DNT backend needs Blender 4.5 or later. Fallback to DATA_TRANSFER.")
+        return 'DATA_TRANSFER'
+    return backend
+
+
+def new_dnt_normal_modifier(obj:bpy.types.Object, backend:str, name:str=ct.DNT_NORMAL_TRANSFER_NAME)->bpy.types.Modifier:
+    """Create DNT normal modifier for given backend.
+
+    Args:
+        obj: modifier is added to this object.
+        backend: 'DATA_TRANSFER' or 'GEOMETRY_NODES'
+        name: modifier name.
+    """
+    if backend == 'GEOMETRY_NODES':
+        mod_dnt_nromal = obj.modifiers.new(name=name, type="NODES")
+        mod_dnt_nromal.node_group = get_or_create_dnt_normal_node_group()
+        mod_dnt_nromal.show_in_editmode = True
+        return mod_dnt_nromal
+
+    mod_dnt_nromal = obj.modifiers.new(name=name, type="DATA_TRANSFER")
+    mod_dnt_nromal.use_object_transform = False
+    mod_dnt_nromal.use_loop_data = True
+    mod_dnt_nromal.data_types_loops = {'CUSTOM_NORMAL'}
+    mod_dnt_nromal.loop_mapping = 'POLYINTERP_NEAREST'
+    mod_dnt_nromal.show_in_editmode = True
+    return mod_dnt_nromal
+
+
+def get_dnt_normal_source_object(mod:bpy.types.Modifier)->bpy.types.Object:
+    """Get normal source object of DNT normal modifier. Works for both DATA_TRANSFER and NODES modifier.
+    Returns None if modifier is None or source is not set.
+    """
+    if mod is None:
+        return None
+    if mod.type == 'NODES':
+        identifier = _get_dnt_normal_source_identifier(mod.node_group)
+        return mod.get(identifier) if identifier is not None else None
+    return getattr(mod, 'object', None)
+
+
+def set_dnt_normal_source_object(mod:bpy.types.Modifier, src_obj:bpy.types.Object):
+    """Set normal source object of DNT normal modifier. Works for both DATA_TRANSFER and NODES modifier.
+    """
+    if mod.type == 'NODES':
+        identifier = _get_dnt_normal_source_identifier(mod.node_group)
+        if identifier is None:
+            print(f"'{mod.name}' node group has no '{ct.DNT_NORMAL_NODE_GROUP_SOURCE_INPUT}' input.")
+            return
+        mod[identifier] = src_obj
+        mod.id_data.update_tag() # assigning modifier input does not tag the object.
+    else:
+        mod.object = src_obj
+    return
+
+
+def _get_dnt_normal_source_identifier(node_group:bpy.types.NodeTree)->str:
+    """Get modifier input identifier of source object socket. e.g. 'Socket_1'"""
+    if node_group is None:
+        return None
+    socket = node_group.interface.items_tree.get(ct.DNT_NORMAL_NODE_GROUP_SOURCE_INPUT)
+    if socket is None:
+        return None
+    return socket.identifier
+
+
+def get_or_create_dnt_normal_node_group()->bpy.types.GeometryNodeTree:
+    """Get geometry nodes group for DNT normal transfer. If not found, build it.
+    The group samples corner normal of 'Source' object at nearest surface point in its original space
+    (same as use_object_transform=False) and writes it as custom normal.
+    Corner normals include custom normals of source (weighted normal, normal transfer), so the result matches
+    data transfer backend with CUSTOM_NORMAL and POLYINTERP_NEAREST.
+    """
+    node_group = bpy.data.node_groups.get(ct.DNT_NORMAL_NODE_GROUP_NAME)
+    if node_group is not None and node_group.bl_idname == 'GeometryNodeTree':
+        for node in node_group.nodes: # group built by older version evaluated flat face normals.
+            if node.bl_idname == "GeometryNodeFieldOnDomain" and node.domain != 'CORNER':
+                node.domain = 'CORNER'
+        return node_group
+
+    node_group = bpy.data.node_groups.new(name=ct.DNT_NORMAL_NODE_GROUP_NAME, type='GeometryNodeTree')
+    node_group.is_modifier = True
+
+    interface = node_group.interface
+    interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    interface.new_socket(name=ct.DNT_NORMAL_NODE_GROUP_SOURCE_INPUT, in_out='INPUT', socket_type='NodeSocketObject')
+    interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = node_group.nodes
+    links = node_group.links
+
+    group_input = nodes.new("NodeGroupInput")
+    group_input.location = (-800, 0)
+
+    object_info = nodes.new("GeometryNodeObjectInfo")
+    object_info.transform_space = 'ORIGINAL'
+    object_info.location = (-600, -200)
+
+    source_normal = nodes.new("GeometryNodeInputNormal")
+    source_normal.location = (-800, -400)
+
+    corner_normal = nodes.new("GeometryNodeFieldOnDomain")
+    corner_normal.data_type = 'FLOAT_VECTOR'
+    corner_normal.domain = 'CORNER'
+    corner_normal.location = (-600, -400)
+
+    sample_nearest = nodes.new("GeometryNodeSampleNearestSurface")
+    sample_nearest.data_type = 'FLOAT_VECTOR'
+    sample_nearest.location = (-400, -200)
+
+    normalize = nodes.new("ShaderNodeVectorMath")
+    normalize.operation = 'NORMALIZE'
+    normalize.location = (-200, -200)
+
+    set_normal = nodes.new("GeometryNodeSetMeshNormal")
+    set_normal.mode = 'FREE'
+    set_normal.domain = 'CORNER'
+    set_normal.location = (0, 0)
+
+    group_output = nodes.new("NodeGroupOutput")
+    group_output.location = (200, 0)
+
+    links.new(group_input.outputs[ct.DNT_NORMAL_NODE_GROUP_SOURCE_INPUT], object_info.inputs["Object"])
+    links.new(object_info.outputs["Geometry"], sample_nearest.inputs["Mesh"])
+    links.new(source_normal.outputs["Normal"], corner_normal.inputs[0])
+    links.new(corner_normal.outputs[0], sample_nearest.inputs["Value"])
+    links.new(sample_nearest.outputs["Value"], normalize.inputs[0])
+    links.new(group_input.outputs["Geometry"], set_normal.inputs["Mesh"])
+    links.new(normalize.outputs["Vector"], set_normal.inputs["Custom Normal"])
+    links.new(set_normal.outputs["Mesh"], group_output.inputs["Geometry"])
+
+    return node_group
+
+
+def time_object_evaluation(obj:bpy.types.Object, runs:int=5)->float:
+    """Time depsgraph evaluation of given object.
+    Object is tagged for geometry update on every run, so whole modifier stack is evaluated each time.
+
+    Returns:
+        median of evaluation time in seconds.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    samples = []
+    for _ in range(max(runs, 1)):
+        obj.update_tag(refresh={'DATA'})
+        start = time.perf_counter()
+        depsgraph.update()
+        obj_eval = obj.evaluated_get(depsgraph)
+        obj_eval.to_mesh()
+        samples.append(time.perf_counter() - start)
+        obj_eval.to_mesh_clear()
+
+    return float(np.median(samples))
+
+
+def benchmark_dnt_backends(obj:bpy.types.Object, runs:int=5)->dict:
+    """Compare evaluation time of DNT backends on given object.
+    For each backend, temporary DNT normal modifier is added using the current DNT normal source object,
+    and original DNT normal modifier is disabled while timing.
+
+    Returns:
+        dictionary of {backend: seconds}. Empty if object has no DNT normal modifier with source.
+    """
+    mod_dnt_nromal = obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME)
+    normal_ref_obj = get_dnt_normal_source_object(mod_dnt_nromal)
+    if normal_ref_obj is None:
+        print(f"'{obj.name}' does not have {ct.DNT_NORMAL_TRANSFER_NAME} modifier with source object.")
+        return {}
+
+    backends = ['DATA_TRANSFER']
+    if bpy.app.version >= (4, 5, 0):
+        backends.append('GEOMETRY_NODES')
+
+    orig_show_viewport = mod_dnt_nromal.show_viewport
+    mod_dnt_nromal.show_viewport = False
+    results = {}
+    try:
+        for backend in backends:
+            bench_mod = new_dnt_normal_modifier(obj, backend, name=ct.DNT_BENCHMARK_MODIFIER_NAME)
+            set_dnt_normal_source_object(bench_mod, normal_ref_obj)
+            try:
+                results[backend] = time_object_evaluation(obj, runs)
+            finally:
+                obj.modifiers.remove(bench_mod)
+    finally:
+        mod_dnt_nromal.show_viewport = orig_show_viewport
+
+    return results
+
+
+
+def clean_up_dnt_modifiers(obj:bpy.types.Object):
+    """Remove DNT modifiers from given object
+    Remove DNT bevel modifier and DNT normal transfer modifier from given object.
+    
+    Args:
+        obj: DNT modifiers on this object is cleaned up.
+    """
+    dnt_bevel = obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME)
+    dnt_normal_transfer = obj.modifiers.get(ct.DNT_BEVEL_NAME)
+
+    if dnt_bevel is not None:
+        obj.modifiers.remove(dnt_bevel)    
+    if dnt_normal_transfer is not None:
+        obj.modifiers.remove(dnt_normal_transfer)
+
+    return
+
+
+def remove_unused_dnt_normal_object(unused_objs:List[bpy.types.Object]):
+    """Cleanup unused generated DNT Normal object
+    Remove unused DNT Normal source objects.
+    """
+    for obj in unused_objs:
+        bpy.data.objects.remove(obj)
+    return
+
+
+def find_orphaned_dnt_normal_objects(dnt_normal_objs:List[bpy.types.Object]=None)->List[bpy.types.Object]:
+    """Find local DNT normal objects which are not referred by any DNT modifier in all scenes.
+    Users are looked up with bpy.data.user_map(), so only objects actually using them are checked.
+
+    Args:
+        dnt_normal_objs: Candidates to check. If None, all local DNT normal objects are checked.
+    """
+    if dnt_normal_objs is None:
+        dnt_normal_objs = [o for o in bpy.data.objects if o.library is None and getattr(o, ct.IS_DNT_NORMAL_OBJECT)]
+    if len(dnt_normal_objs) == 0:
+        return []
+
+    user_map = bpy.data.user_map(subset=dnt_normal_objs, value_types={'OBJECT'})
+    return [
+        dnt_obj for dnt_obj, users in user_map.items()
+        if not any(is_dnt_normal_object_referrer(u, dnt_obj) for u in users)
+        ]
+
+
+def is_dnt_normal_object_referrer(obj:bpy.types.Object, dnt_normal_obj:bpy.types.Object)->bool:
+    """Check if object uses DNT normal object as source of DNT normal or consolidated normal transfer modifier."""
+    return dnt_normal_obj in get_dnt_source_objects(obj)
+
+
+def get_dnt_source_objects(obj:bpy.types.Object)->List[bpy.types.Object]:
+    """Get generated source objects referred by DNT normal and consolidated normal transfer modifiers."""
+    if obj.type != 'MESH':
+        return []
+
+    src_objs = []
+    dnt_normal_mod = obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME)
+    if dnt_normal_mod is not None:
+        src_objs.append(get_dnt_normal_source_object(dnt_normal_mod))
+
+    consolidated_mod = obj.modifiers.get(ct.MD_NORMAL_CONSOLIDATED_NAME)
+    if consolidated_mod is not None:
+        src_objs.append(consolidated_mod.object)
+
+    return [o for o in src_objs if o is not None]
+
+
+ATTRIBUTE_DATA_TYPE_BYTES = {
+    'FLOAT': 4,
+    'INT': 4,
+    'FLOAT_VECTOR': 12,
+    'FLOAT_COLOR': 16,
+    'BYTE_COLOR': 4,
+    'STRING': 1,
+    'BOOLEAN': 1,
+    'FLOAT2': 8,
+    'INT8': 1,
+    'INT16_2D': 4,
+    'INT32_2D': 8,
+    'QUATERNION': 16,
+    'FLOAT4X4': 64,
+}
+
+
+def estimate_mesh_bytes(mesh:bpy.types.Mesh)->int:
+    """Rough estimate of mesh size in blend file, sum of attribute arrays and face offsets."""
+    attribute_bytes = sum(len(a.data) * ATTRIBUTE_DATA_TYPE_BYTES.get(a.data_type, 4) for a in mesh.attributes)
+    face_offset_bytes = (len(mesh.polygons) + 1) * 4
+    return attribute_bytes + face_offset_bytes
+
+
+def collect_orphaned_dnt_normal_objects(dry_run:bool=False)->dict:
+    """Remove orphaned DNT normal objects in current file.
+    Mesh is counted as reclaimed only when orphaned object is its only user,
+    since DNT normal object shares mesh with original object.
+
+    Returns:
+        report: {'filepath': str, 'objects': list of object names, 'bytes': estimated reclaimed bytes}
+    """
+    orphaned_objs = find_orphaned_dnt_normal_objects()
+    reclaimed_meshes = [o.data for o in orphaned_objs if o.type == 'MESH' and o.data.users == 1]
+
+    report = {
+        'filepath': bpy.data.filepath,
+        'objects': [o.name for o in orphaned_objs],
+        'bytes': sum(estimate_mesh_bytes(m) for m in reclaimed_meshes),
+    }
+    if dry_run:
+        return report
+
+    for obj in orphaned_objs:
+        bpy.data.objects.remove(obj)
+    for mesh in reclaimed_meshes:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+    print(f"Removed {len(report['objects'])} orphaned DNT normal objects ({report['bytes']} bytes): '{bpy.data.filepath}'")
+    return report
+
+
+#-------------------------------------------------------------------------------
+# DNT Auto Cleanup On Save
+#-------------------------------------------------------------------------------
+class DNTOwnerTracker:
+    """Keep which DNT normal objects are referred by DNT modifiers in current file.
+    Owners and DNT normal objects are updated only for objects reported by depsgraph updates,
+    and deleted ones are dropped when object count decreases, so saving doesn't walk every object.
+    Keys are session_uid. References are dropped on undo/load, where IDs are reallocated.
+    """
+    owner_sources:dict = {} # owner session_uid -> set of source session_uid
+    dnt_normal_objects:dict = {} # session_uid -> local DNT normal object
+    object_count:int = 0
+    is_valid:bool = False
+
+    @classmethod
+    def invalidate(cls):
+        cls.owner_sources = {}
+        cls.dnt_normal_objects = {}
+        cls.object_count = 0
+        cls.is_valid = False
+
+    @classmethod
+    def rebuild(cls):
+        cls.owner_sources = {}
+        cls.dnt_normal_objects = {}
+        for obj in bpy.data.objects:
+            cls.update_object(obj)
+        cls.object_count = len(bpy.data.objects)
+        cls.is_valid = True
+
+    @classmethod
+    def update_object(cls, obj:bpy.types.Object):
+        source_uids = {o.session_uid for o in get_dnt_source_objects(obj)}
+        if len(source_uids) > 0:
+            cls.owner_sources[obj.session_uid] = source_uids
+        else:
+            cls.owner_sources.pop(obj.session_uid, None)
+
+        if obj.library is None and getattr(obj, ct.IS_DNT_NORMAL_OBJECT):
+            cls.dnt_normal_objects[obj.session_uid] = obj
+        else:
+            cls.dnt_normal_objects.pop(obj.session_uid, None)
+
+    @classmethod
+    def drop_deleted(cls):
+        """Drop deleted owners and DNT normal objects. Only needed when object count decreased."""
+        object_count = len(bpy.data.objects)
+        if object_count < cls.object_count:
+            live_uids = {o.session_uid for o in bpy.data.objects}
+            for uid in [uid for uid in cls.owner_sources if uid not in live_uids]:
+                del cls.owner_sources[uid]
+            for uid in [uid for uid in cls.dnt_normal_objects if uid not in live_uids]:
+                del cls.dnt_normal_objects[uid]
+        cls.object_count = object_count
+
+    @classmethod
+    def find_orphan_candidates(cls)->List[bpy.types.Object]:
+        """DNT normal objects not referred by tracked owners."""
+        if not cls.is_valid:
+            cls.rebuild()
+        cls.drop_deleted()
+
+        referred_uids = set().union(*cls.owner_sources.values())
+        return [cls.dnt_normal_objects[uid] for uid in cls.dnt_normal_objects.keys() - referred_uids]
+
+
+@persistent
+def track_dnt_owners_on_depsgraph_update(scene, depsgraph):
+    if not get_preferences().auto_cleanup_dnt_on_save:
+        DNTOwnerTracker.invalidate() # rebuilt when enabled again.
+        return
+    if not DNTOwnerTracker.is_valid: # rebuilt on save.
+        return
+
+    DNTOwnerTracker.drop_deleted()
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            DNTOwnerTracker.update_object(update.id.original)
+
+
+@persistent
+def cleanup_dnt_on_save(dummy):
+    """Remove unused DNT normal objects before writing file.
+    Candidates from the tracker are confirmed with bpy.data.user_map() before removal.
+    """
+    if not get_preferences().auto_cleanup_dnt_on_save:
+        return
+
+    candidates = DNTOwnerTracker.find_orphan_candidates()
+    if len(candidates) == 0:
+        return
+
+    orphaned_objs = find_orphaned_dnt_normal_objects(dnt_normal_objs=candidates)
+    if len(orphaned_objs) == 0:
+        return
+    print(f"Auto cleanup removed {len(orphaned_objs)} unused DNT normal objects.")
+    remove_unused_dnt_normal_object(orphaned_objs)
+
+
+@persistent
+def invalidate_dnt_owner_tracker(dummy):
+    """Tracker is per file, and session_uid may be reused after undo."""
+    DNTOwnerTracker.invalidate()
+
+
+def register_dnt_auto_cleanup():
+    bpy.app.handlers.depsgraph_update_post.append(track_dnt_owners_on_depsgraph_update)
+    bpy.app.handlers.save_pre.append(cleanup_dnt_on_save)
+    bpy.app.handlers.load_post.append(invalidate_dnt_owner_tracker)
+    bpy.app.handlers.undo_post.append(invalidate_dnt_owner_tracker)
+    bpy.app.handlers.redo_post.append(invalidate_dnt_owner_tracker)
+
+def unregister_dnt_auto_cleanup():
+    handlers = [
+        (bpy.app.handlers.depsgraph_update_post, track_dnt_owners_on_depsgraph_update),
+        (bpy.app.handlers.save_pre, cleanup_dnt_on_save),
+        (bpy.app.handlers.load_post, invalidate_dnt_owner_tracker),
+        (bpy.app.handlers.undo_post, invalidate_dnt_owner_tracker),
+        (bpy.app.handlers.redo_post, invalidate_dnt_owner_tracker),
+    ]
+    for handler_list, func in handlers:
+        if func in handler_list:
+            handler_list.remove(func)
+
+register_other(
+    register_func=register_dnt_auto_cleanup,
+    unregister_func=unregister_dnt_auto_cleanup)
+
+
 #-------------------------------------------------------------------------------
-# Sync DNT
+# Part Index
 #-------------------------------------------------------------------------------
-def sync_dnt():
-    """Setup and sync DNT
+class PartIndex:
+    """Cached membership index of part collections.
+    Built lazily on first lookup and invalidated when collection hierarchy or file changes,
+    so lookups don't walk bpy.data.collections and children_recursive each time.
+    Object lookups are memoized on demand instead of indexing every object on rebuild.
+    Keys are session_uid.
     """
-    context = bpy.context
-    obj = context.active_object
-        
-    
-    # TODO may be a better way
-    orig_mode = obj.mode
-    bpy.ops.object.mode_set(mode='OBJECT')
-    myu.select_only(obj)
-    bpy.ops.object.shade_smooth()
-    bpy.ops.object.mode_set(mode=orig_mode)
-    
-    # Setup bevel and data transfer modifiers
-    modifier_names = [m.name for m in obj.modifiers]
-    prefs = get_preferences()
+    part_collections:list = []
+    object_to_part:dict = {} # object session_uid -> part collection or None, filled on demand.
+    collection_to_part:dict = {} # collection session_uid -> part collection. Part collection maps to itself.
+    scene_to_parts:dict = {} # scene session_uid -> part collections in scene tree
+    collection_object_uids:dict = {} # collection session_uid -> set of all_objects session_uid, filled on demand.
+    is_valid:bool = False
 
-    if ct.DNT_WEIGHTED_NORMAL_NAME not in modifier_names:
-        mod_w_norm = obj.modifiers.new(name=ct.DNT_WEIGHTED_NORMAL_NAME, type="WEIGHTED_NORMAL")
-        mod_w_norm.mode = 'CORNER_ANGLE'
-        mod_w_norm.keep_sharp = True
-        mod_w_norm.use_face_influence = True
-        mod_w_norm.show_in_editmode = True
+    @classmethod
+    def invalidate(cls):
+        cls.part_collections = []
+        cls.object_to_part = {}
+        cls.collection_to_part = {}
+        cls.scene_to_parts = {}
+        cls.collection_object_uids = {}
+        cls.is_valid = False
 
+    @classmethod
+    def ensure(cls):
+        """Rebuild if invalidated. Removal of collections is caught by hierarchy cache invalidation."""
+        if not cls.is_valid:
+            cls.rebuild()
 
-    if ct.DNT_NORMAL_TRANSFER_NAME not in modifier_names:
-        mod_dnt_nromal = obj.modifiers.new(name=ct.DNT_NORMAL_TRANSFER_NAME, type="DATA_TRANSFER")
+    @classmethod
+    def rebuild(cls):
+        cls.invalidate()
+        cls.part_collections = [c for c in bpy.data.collections if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION)]
 
-        mod_dnt_nromal.use_object_transform = False
-        mod_dnt_nromal.use_loop_data = True
-        mod_dnt_nromal.data_types_loops = {'CUSTOM_NORMAL'}
-        mod_dnt_nromal.loop_mapping = 'POLYINTERP_NEAREST'
-        mod_dnt_nromal.show_in_editmode = True
+        # part itself has priority over parent part, then first found part (bpy.data.collections order).
+        for part in cls.part_collections:
+            cls.collection_to_part[part.session_uid] = part
+        for part in cls.part_collections:
+            for c in part.children_recursive:
+                cls.collection_to_part.setdefault(c.session_uid, part)
 
-    else:
-        mod_dnt_nromal = obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME)
+        for scene in bpy.data.scenes:
+            cls.scene_to_parts[scene.session_uid] = [c for c in scene.collection.children_recursive if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION)]
 
-    if ct.DNT_BEVEL_NAME not in modifier_names:
-        mod_dnt_bevel = obj.modifiers.new(name=ct.DNT_BEVEL_NAME, type="BEVEL")
+        cls.is_valid = True
 
-        mod_dnt_bevel.limit_method = 'WEIGHT'
-        mod_dnt_bevel.offset_type = prefs.default_bevel_width_type
-        mod_dnt_bevel.width = prefs.default_bevel_width
-        mod_dnt_bevel.loop_slide = False
-        mod_dnt_bevel.use_clamp_overlap = False
-        mod_dnt_bevel.show_in_editmode = True
+    @classmethod
+    def _find_part_from_users_collection(cls, obj:bpy.types.Object)->bpy.types.Collection:
+        users_collections = obj.users_collection
+        if len(users_collections) != 1: # not assign to valid collection or multiple collection uses this this object
+            return None
+        return cls.collection_to_part.get(users_collections[0].session_uid)
 
-    else:
-        mod_dnt_bevel = obj.modifiers.get(ct.DNT_BEVEL_NAME)
+    @classmethod
+    def get_part_collections(cls)->List[bpy.types.Collection]:
+        cls.ensure()
+        return cls.part_collections
 
-    
-    # by toggling False -> True, you can ensure the use_pin_to_last order
-    mod_dnt_nromal.use_pin_to_last = False
-    mod_dnt_bevel.use_pin_to_last = False
+    @classmethod
+    def get_part_of_object(cls, obj:bpy.types.Object)->bpy.types.Collection:
+        cls.ensure()
+        if obj.session_uid not in cls.object_to_part:
+            cls.object_to_part[obj.session_uid] = cls._find_part_from_users_collection(obj)
+        return cls.object_to_part[obj.session_uid]
 
-    mod_dnt_nromal.use_pin_to_last = True
-    mod_dnt_bevel.use_pin_to_last = True
+    @classmethod
+    def get_part_of_collection(cls, collection:bpy.types.Collection)->bpy.types.Collection:
+        cls.ensure()
+        return cls.collection_to_part.get(collection.session_uid)
 
+    @classmethod
+    def get_scene_parts(cls, scene:bpy.types.Scene)->List[bpy.types.Collection]:
+        cls.ensure()
+        return cls.scene_to_parts.get(scene.session_uid, [])
 
+    @classmethod
+    def get_all_object_uids(cls, collection:bpy.types.Collection)->set:
+        """session_uid set of collection.all_objects. Used by pointer property poll called per candidate."""
+        cls.ensure()
+        object_uids = cls.collection_object_uids.get(collection.session_uid)
+        if object_uids is None:
+            object_uids = {o.session_uid for o in collection.all_objects}
+            cls.collection_object_uids[collection.session_uid] = object_uids
+        return object_uids
+
+
+class CollectionTreeIndex:
+    """Cached flat map of scene collection tree.
+    Maps collection to bpy.ops.object.hide_collection index, index in scene.collection.children and
+    LayerCollection, so visibility toggles don't walk the tree. Invalidated with PartIndex.
+    If the same collection is linked several times, the first one in hide_collection order is used.
+    """
+    operator_indices:dict = {} # scene session_uid -> {collection session_uid: hide_collection index (starts from 1)}
+    scene_child_indices:dict = {} # scene session_uid -> {collection session_uid: index in scene.collection.children}
+    layer_collections:dict = {} # (scene session_uid, view layer name) -> {collection session_uid: LayerCollection}
 
-    # Generate collection to store generated DNT normal source object.
-    dnt_collection = PartManager.get_mk_reserved_collection_from_obj(obj, ct.DNT_COLLECTION, fallback=bpy.context.scene.collection)
-    dnt_collection.hide_render = True
-    dnt_collection.hide_viewport = True
+    @classmethod
+    def invalidate(cls):
+        cls.operator_indices = {}
+        cls.scene_child_indices = {}
+        cls.layer_collections = {}
 
-    # remove previously created DNT normal source object
-    prev_normal_ref_obj = obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME).object
-    if prev_normal_ref_obj is not None:
-        bpy.data.objects.remove(prev_normal_ref_obj)
+    @classmethod
+    def get_operator_index(cls, scene:bpy.types.Scene, collection:bpy.types.Collection)->int:
+        """Returns None if collection is not in scene."""
+        indices = cls.operator_indices.get(scene.session_uid)
+        if indices is None:
+            indices = {}
+            cls._number_collections(list(scene.collection.children), indices, 0)
+            cls.operator_indices[scene.session_uid] = indices
+        return indices.get(collection.session_uid)
 
-    # create normal transfer source object.
-    normal_ref_obj = obj.copy()
-    normal_ref_obj.name = f"{ct.DNT_NORMAL_TRANSFER_NAME}-{obj.name}"
-    setattr(normal_ref_obj, ct.IS_DNT_NORMAL_OBJECT, True)
-    clean_up_dnt_modifiers(normal_ref_obj)
-    dnt_collection.objects.link(normal_ref_obj)
+    @classmethod
+    def get_scene_child_index(cls, scene:bpy.types.Scene, collection:bpy.types.Collection)->int:
+        """Returns None if collection is not direct child of scene collection."""
+        indices = cls.scene_child_indices.get(scene.session_uid)
+        if indices is None:
+            indices = {}
+            for i, c in enumerate(scene.collection.children):
+                indices.setdefault(c.session_uid, i)
+            cls.scene_child_indices[scene.session_uid] = indices
+        return indices.get(collection.session_uid)
 
+    @classmethod
+    def get_layer_collection(cls, scene:bpy.types.Scene, view_layer:bpy.types.ViewLayer, collection:bpy.types.Collection)->bpy.types.LayerCollection:
+        """Returns None if collection is not in view layer."""
+        key = (scene.session_uid, view_layer.name)
+        layer_cols = cls.layer_collections.get(key)
+        if layer_cols is None:
+            layer_cols = {}
+            cls._collect_layer_collections(view_layer.layer_collection.children, layer_cols)
+            cls.layer_collections[key] = layer_cols
+        return layer_cols.get(collection.session_uid)
 
-    # setup data transfer modifier rerference object
-    mod_dnt_nromal.object = normal_ref_obj
-    return
+    @classmethod
+    def _number_collections(cls, collection_list:List[bpy.types.Collection], indices:dict, index:int)->int:
+        """Same order as bpy.ops.object.hide_collection. Siblings first, then children of each sibling."""
+        for c in collection_list:
+            index += 1
+            indices.setdefault(c.session_uid, index)
+        for c in collection_list:
+            index = cls._number_collections(list(c.children), indices, index)
+        return index
 
+    @classmethod
+    def _collect_layer_collections(cls, layer_col_list, layer_cols:dict):
+        for layer_col in layer_col_list:
+            layer_cols.setdefault(layer_col.collection.session_uid, layer_col)
+        for layer_col in layer_col_list:
+            cls._collect_layer_collections(layer_col.children, layer_cols)
+
+
+class PanelState:
+    """Part state drawn in sidebar panels."""
+    def __init__(self, scene:bpy.types.Scene):
+        self.active_uilist_collection:bpy.types.Collection = getattr(scene, ct.ACTIVE_UILIST_COLLECTION)
+        self.active_part_collection:bpy.types.Collection = getattr(scene, ct.ACTIVE_PART_COLLECTION)
+        self.is_part:bool = self.active_uilist_collection is not None and getattr(self.active_uilist_collection, ct.IS_MD_HARDSURF_PART_COLLECTION)
+        self.reserved_collections:dict = {} # prefix -> reserved collection under active part
+        self.visibilities:dict = {} # prefix -> visibility property of reserved collection
+        if self.active_uilist_collection is not None:
+            self.reserved_collections = PartManager.get_collection_dict(self.active_uilist_collection)
+            self.visibilities = PartManager.get_collection_visibility_dict(self.active_uilist_collection)
+
+
+class PanelViewModel:
+    """Cache PanelState per scene, so panel redraws don't scan collections.
+    Invalidated by msgbus subscriptions (see props.py) and hierarchy changes.
+    """
+    states:dict = {} # scene session_uid -> PanelState
 
+    @classmethod
+    def invalidate(cls, *args):
+        cls.states = {}
 
-def clean_up_dnt_modifiers(obj:bpy.types.Object):
-    """Remove DNT modifiers from given object
-    Remove DNT bevel modifier and DNT normal transfer modifier from given object.
-    
-    Args:
-        obj: DNT modifiers on this object is cleaned up.
+    @classmethod
+    def get(cls, scene:bpy.types.Scene)->PanelState:
+        state = cls.states.get(scene.session_uid)
+        if state is None:
+            state = PanelState(scene)
+            cls.states[scene.session_uid] = state
+        return state
+
+
+class SceneCollectionListCache:
+    """Cache filter flags and order of scene collection UIList between redraws.
+    Recent use is kept in python dict instead of RNA property, so activation doesn't write to file data.
     """
-    dnt_bevel = obj.modifiers.get(ct.DNT_NORMAL_TRANSFER_NAME)
-    dnt_normal_transfer = obj.modifiers.get(ct.DNT_BEVEL_NAME)
+    entries:dict = {} # (scene session_uid, item count, filter settings...) -> (flt_flags, flt_neworder)
+    recent_uses:dict = {} # collection session_uid -> use count, larger is more recent.
+    use_count:int = 0
 
-    if dnt_bevel is not None:
-        obj.modifiers.remove(dnt_bevel)    
-    if dnt_normal_transfer is not None:
-        obj.modifiers.remove(dnt_normal_transfer)
+    @classmethod
+    def invalidate(cls, *args):
+        cls.entries = {}
 
-    return
+    @classmethod
+    def reset(cls):
+        cls.entries = {}
+        cls.recent_uses = {}
+        cls.use_count = 0
 
+    @classmethod
+    def touch(cls, collection:bpy.types.Collection):
+        cls.use_count += 1
+        cls.recent_uses[collection.session_uid] = cls.use_count
+        cls.entries = {} # recent order changed.
 
-def remove_unused_dnt_normal_object(unused_objs:List[bpy.types.Object]):
-    """Cleanup unused generated DNT Normal object
-    Remove unused DNT Normal source objects.
+    @classmethod
+    def get_recent_use(cls, collection:bpy.types.Collection)->int:
+        return cls.recent_uses.get(collection.session_uid, 0)
+
+
+def invalidate_panel_caches(*args):
+    """Invalidate caches of sidebar drawing. Used as msgbus callback."""
+    PanelViewModel.invalidate()
+    SceneCollectionListCache.invalidate()
+
+
+def invalidate_hierarchy_caches():
+    """Invalidate caches which depend on collection hierarchy."""
+    PartIndex.invalidate()
+    CollectionTreeIndex.invalidate()
+    invalidate_panel_caches()
+
+
+scene_children_signatures:dict = {} # scene session_uid -> session_uid tuple of scene.collection.children
+
+
+def is_scene_children_changed(scene:bpy.types.Scene)->bool:
+    """Check if direct children of scene master collection changed since last call.
+    Master collection is not an ID, so its change is reported only as scene update, together with
+    selection, frame change etc. Comparing direct children separates hierarchy changes from them.
     """
-    for obj in unused_objs:
-        bpy.data.objects.remove(obj)
-    return
+    signature = tuple(c.session_uid for c in scene.collection.children)
+    is_changed = scene_children_signatures.get(scene.session_uid) != signature
+    scene_children_signatures[scene.session_uid] = signature
+    return is_changed
+
+
+@persistent
+def invalidate_hierarchy_caches_on_depsgraph_update(scene, depsgraph):
+    # object link/unlink tags collection, so object memo of PartIndex is also covered by collection update.
+    if depsgraph.id_type_updated('COLLECTION'):
+        is_scene_children_changed(scene) # keep signature up to date.
+        invalidate_hierarchy_caches()
+    elif depsgraph.id_type_updated('SCENE') and is_scene_children_changed(scene):
+        invalidate_hierarchy_caches()
+
+
+@persistent
+def invalidate_hierarchy_caches_on_load(dummy):
+    scene_children_signatures.clear()
+    invalidate_hierarchy_caches()
+
+
+@persistent
+def reset_scene_collection_list_cache_on_load(dummy):
+    SceneCollectionListCache.reset()
+
+
+def register_hierarchy_cache_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_hierarchy_caches_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(invalidate_hierarchy_caches_on_load)
+    bpy.app.handlers.load_post.append(reset_scene_collection_list_cache_on_load)
+    bpy.app.handlers.undo_post.append(invalidate_hierarchy_caches_on_load)
+    bpy.app.handlers.redo_post.append(invalidate_hierarchy_caches_on_load)
+
+def unregister_hierarchy_cache_handlers():
+    handlers = [
+        (bpy.app.handlers.depsgraph_update_post, invalidate_hierarchy_caches_on_depsgraph_update),
+        (bpy.app.handlers.load_post, invalidate_hierarchy_caches_on_load),
+        (bpy.app.handlers.load_post, reset_scene_collection_list_cache_on_load),
+        (bpy.app.handlers.undo_post, invalidate_hierarchy_caches_on_load),
+        (bpy.app.handlers.redo_post, invalidate_hierarchy_caches_on_load),
+    ]
+    for handler_list, func in handlers:
+        if func in handler_list:
+            handler_list.remove(func)
+
+register_other(
+    register_func=register_hierarchy_cache_handlers,
+    unregister_func=unregister_hierarchy_cache_handlers)
 
 
 def get_parent_part_collection(obj:bpy.types.Object, fallback:bpy.types.Collection=None)->bpy.types.Collection:
@@ -565,25 +2022,8 @@ def get_parent_part_collection(obj:bpy.types.Object, fallback:bpy.types.Collecti
     Return:
         collection which has IS_MD_HARDSURF_PART_COLLECTION == True property, and it contains given object.
     """
-    md_hard_surface_part_collections = [c for c in bpy.data.collections if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION) == True]
-    users_collections = obj.users_collection
-
-    if len(users_collections) != 1: # not assign to valid collection or multiple collection uses this this object
-        return fallback
-    else:
-        user_collection = users_collections[0]
-
-    # when object is directly under part collection
-    if getattr(user_collection, ct.IS_MD_HARDSURF_PART_COLLECTION):
-        return user_collection
-
-    for c in md_hard_surface_part_collections:
-        if user_collection in c.children_recursive:
-            return c
-        else:
-            continue
-
-    return fallback
+    part_collection = PartIndex.get_part_of_object(obj)
+    return part_collection if part_collection is not None else fallback
 
 
 def setup_part_collection(part_name:str="Part"):
@@ -599,6 +2039,7 @@ def setup_part_collection(part_name:str="Part"):
     part_collection.color_tag = 'COLOR_01'
     setattr(part_collection, ct.IS_MD_HARDSURF_PART_COLLECTION, True)
     scene.collection.children.link(part_collection)
+    invalidate_hierarchy_caches()
     
     setup_reserved_part_collection(part_collection)
     setattr(scene, ct.SCENE_COLLECTION_CHILD_INDEX, len(scene.collection.children)-1) # activate after creation
@@ -786,20 +2227,30 @@ class PartManager:
     def fix_part_visibility(cls, part_collection:bpy.types.Collection):
         """fix part render and viewport visibility of given part collection.
         """
-        cols_under_part_dict = cls.get_collection_dict(part_collection)
+        target_ids = cls.gather_fix_visibility_targets(part_collection, target_ids={})
+        return set_hide_state_if_changed(target_ids.values(), render=False, viewport=False)
+
 
-        final_collection = cols_under_part_dict.get(ct.FINAL_COLLECTION, None)
-        dep_collection = cols_under_part_dict.get(ct.DEP_COLLECTION, None)
-        design_collection = cols_under_part_dict.get(ct.DESIGN_COLLECTION, None)
-        normal_collection = cols_under_part_dict.get(ct.NORMAL_COLLECTION, None)
-        dnt_collection = cols_under_part_dict.get(ct.DNT_COLLECTION, None)
+    @classmethod
+    def gather_fix_visibility_targets(cls, part_collection:bpy.types.Collection, target_ids:dict)->dict:
+        """Gather F- and DEP- collections under part, their nested collections and objects.
+        Collections and objects shared by several parts are added only once.
 
+        Args:
+            target_ids: session_uid -> Collection or Object. Gathered ids are added to this.
+        """
+        cols_under_part_dict = cls.get_collection_dict(part_collection)
 
-        cls._set_hide_state(col=final_collection,  render=False, viewport=False)
-        cls._set_hide_state(col=dep_collection,    render=False, viewport=False)
-        # cls._set_visibility(col=design_collection, render=False, viewport=True)
-        # cls._set_visibility(col=normal_collection, render=False, viewport=True)
-        # cls._set_visibility(col=dnt_collection,    render=True, viewport=True)
+        for prefix in [ct.FINAL_COLLECTION, ct.DEP_COLLECTION]: # design, normal and DNT collections are kept as they are.
+            col = cols_under_part_dict.get(prefix, None)
+            if col is None or col.session_uid in target_ids: # already gathered with nested collections.
+                continue
+            target_ids[col.session_uid] = col
+            for c in col.children_recursive:
+                target_ids.setdefault(c.session_uid, c)
+            for o in col.all_objects:
+                target_ids.setdefault(o.session_uid, o)
+        return target_ids
 
 
     @classmethod
@@ -808,19 +2259,7 @@ class PartManager:
         It also set visibility under all nested object and collection.
         """
         if col is not None:
-            if render is not None:
-                col.hide_render = render
-                for c in col.children_recursive:
-                    c.hide_render = render
-                for o in col.all_objects[:]:
-                    o.hide_render = render
-            
-            if viewport is not None:
-                col.hide_viewport = viewport
-                for c in col.children_recursive:
-                    c.hide_viewport = render
-                for o in col.all_objects[:]:
-                    o.hide_viewport = render
+            set_hide_state_if_changed([col] + col.children_recursive + col.all_objects[:], render=render, viewport=viewport)
 
     
 
@@ -871,7 +2310,7 @@ def callback_go_to_part_collection(self, context):
     """Callback function for go to part.
     """
     # get local part collection names.
-    part_col_names = [c.name for c in bpy.data.collections if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION, False) and (c.library is None)]
+    part_col_names = [c.name for c in PartIndex.get_part_collections() if c.library is None]
     enum_list = [(name, name, "") for name in part_col_names]
     
     return enum_list
@@ -903,6 +2342,7 @@ def unlink_ui_list_collection(ui_list_collection:bpy.types.Collection):
 
     ui_list_collection.use_fake_user = True
     sn_col_children.unlink(ui_list_collection)
+    invalidate_hierarchy_caches()
     
     new_index = max(min(len(sn_col_children)-1, active_index), 0) # try active index stay the same. but les than length and more than zero.
     setattr(sn, ct.SCENE_COLLECTION_CHILD_INDEX, new_index)
@@ -918,7 +2358,16 @@ def get_scene_which_has_this_collection(collection:bpy.types.Collection, childre
         fallback: If there is no scene which has given part collection, then return this fallback
     """
     # search is starting from this scene
-    if children_recursive == True:
+    if children_recursive == True and getattr(collection, ct.IS_MD_HARDSURF_PART_COLLECTION): # part collection, use index.
+        if collection in PartIndex.get_scene_parts(bpy.context.scene):
+            return bpy.context.scene
+
+        for s in bpy.data.scenes:
+            if collection in PartIndex.get_scene_parts(s):
+                return s
+        else:
+            print(f"no collection found in scenes (check children_recursive). Fallback to default {fallback}")
+    elif children_recursive == True:
         if collection in bpy.context.scene.collection.children_recursive[:]:
             return bpy.context.scene
 
@@ -953,12 +2402,12 @@ def set_this_part_active_in_scene(part_collection:bpy.types.Collection, scene:bp
     """
     scene_col = scene.collection
 
-    try:
-        index = scene_col.children[:].index(part_collection)
-    except ValueError:
+    index = CollectionTreeIndex.get_scene_child_index(scene, part_collection)
+    if index is None:
         if not create:
             return
         scene_col.children.link(part_collection)
+        invalidate_hierarchy_caches()
         index = len(scene_col.children) - 1
         
     setattr(scene, ct.SCENE_COLLECTION_CHILD_INDEX, index)
@@ -977,6 +2426,8 @@ def update_scene_ui_list_active_part_collection(self, context):
     active_col = get_ui_list_active_collection_from_index(scene=scene, active_index=active_index) # might be none, if there is no collection in scene.
 
     setattr(scene, ct.ACTIVE_UILIST_COLLECTION, active_col) # This Alwarys returns active collection in the UIList.
+    if active_col is not None:
+        SceneCollectionListCache.touch(active_col)
 
     if active_col is not None:
         if getattr(active_col, ct.IS_MD_HARDSURF_PART_COLLECTION) == False:
@@ -984,39 +2435,72 @@ def update_scene_ui_list_active_part_collection(self, context):
 
     
     setattr(scene, ct.ACTIVE_PART_COLLECTION, active_col) # update readonly property. This returns None when collection is not Part
-    bpy.ops.object.hide_collection(collection_index=active_index+1) # collection_index is stargint from 1.
 
-    if active_col is not None: # only apply this code to valid part collection
-        restore_child_collection_visibility_under_part(active_col) # you need to restore visibility, because, hide_collection automatically enable visibility of all child collection.
+    ui_list_col = getattr(scene, ct.ACTIVE_UILIST_COLLECTION)
+    if ui_list_col is not None:
+        isolate_scene_child_collection(context.view_layer, ui_list_col)
 
     return
 
-def restore_child_collection_visibility_under_part(part_collection:bpy.types.Collection):
-    """Restore child collection visibility under Part.
-    After the use of bpy.ops.object.hide_collection, All of the child collection visibilities
-    will be automatically updated as True. With this function, you can restore original visibility after the hide_correction
-    This function works only for Part Collection.
 
-    TODO:
-        make this work other than part collection. This function uses custom visibility property on collection.
-        this property is managed only through toggle part child collection visibility toggle operator. Thus visibility property on non-part collection
-        won't be updated so its not possible to restore visibility.
+def isolate_scene_child_collection(view_layer:bpy.types.ViewLayer, scene_child_col:bpy.types.Collection):
+    """Isolate direct child collection of scene collection by setting LayerCollection.hide_viewport in one pass.
+    Result is the same as bpy.ops.object.hide_collection followed by restoration of part child visibilities,
+    but only one depsgraph update happens.
+
+    Target state:
+        Other scene children and everything under them are hidden.
+        In 'EXCLUDE' isolation mode, other part collections are excluded instead, so they are not evaluated.
+        In 'HIDE' isolation mode, part collections excluded before are included again and hidden.
+        Under part collection, only reserved collections whose visibility property is True are visible.
+        Under non-part collection, everything is visible.
     """
-    visibilities = PartManager.get_collection_visibility_dict(part_collection)
-    part_child_collection_dict = PartManager.get_collection_dict(part_collection)
+    visible_child_uids = None # None means all children are visible.
+    if getattr(scene_child_col, ct.IS_MD_HARDSURF_PART_COLLECTION):
+        visibilities = PartManager.get_collection_visibility_dict(scene_child_col)
+        part_child_collection_dict = PartManager.get_collection_dict(scene_child_col)
+        visible_child_uids = {col.session_uid for key, col in part_child_collection_dict.items() if visibilities.get(key, False)}
+
+    use_exclude = get_preferences().part_isolation_mode == 'EXCLUDE'
+    active_layer_col = CollectionTreeIndex.get_layer_collection(view_layer.id_data, view_layer, scene_child_col)
+    for layer_col in view_layer.layer_collection.children:
+        if layer_col == active_layer_col:
+            continue
+        is_part = getattr(layer_col.collection, ct.IS_MD_HARDSURF_PART_COLLECTION)
+        if use_exclude and is_part:
+            _set_layer_collection_exclude(layer_col, True) # child hide state is kept while excluded.
+        else:
+            if is_part: # may be excluded by 'EXCLUDE' isolation mode before.
+                _set_layer_collection_exclude(layer_col, False)
+            _set_layer_collection_hide_recursive(layer_col, True)
+
+    if active_layer_col is not None:
+        # activated part is always included, even if excluded by other isolation mode before.
+        _set_layer_collection_exclude(active_layer_col, False)
+        _set_layer_collection_hide(active_layer_col, False)
+        for child_layer_col in active_layer_col.children:
+            hide = visible_child_uids is not None and child_layer_col.collection.session_uid not in visible_child_uids
+            _set_layer_collection_hide_recursive(child_layer_col, hide)
+    return
 
-    
-    if len(part_collection.children) > 0: # hide all before restoration.
-        # by toggling on and off, you can hide everything in the part collection.
-        isolate_collection_under_scene(part_collection.children[0], extend=False)
-        isolate_collection_under_scene(part_collection.children[0], extend=True)
 
-    # starting from zero visibility is easy.
-    for key, col in part_child_collection_dict.items():
-        if visibilities.get(key, False):
-            isolate_collection_under_scene(col, extend=True)
+def _set_layer_collection_hide_recursive(layer_col:bpy.types.LayerCollection, hide:bool):
+    _set_layer_collection_hide(layer_col, hide)
+    for child_layer_col in layer_col.children:
+        _set_layer_collection_hide_recursive(child_layer_col, hide)
+
+
+def _set_layer_collection_hide(layer_col:bpy.types.LayerCollection, hide:bool):
+    """Write only when changed, each write tags view layer resync."""
+    if layer_col.hide_viewport != hide:
+        layer_col.hide_viewport = hide
+
+
+def _set_layer_collection_exclude(layer_col:bpy.types.LayerCollection, exclude:bool):
+    """Write only when changed, exclude change rebuilds depsgraph relations."""
+    if layer_col.exclude != exclude:
+        layer_col.exclude = exclude
 
-    return
 
 def get_ui_list_active_collection_from_index(scene:bpy.types.Scene, active_index:int):
     """Get Scene UIList active collection safely. index out of range is treated.
@@ -1053,20 +2537,67 @@ def move_active_collection_in_ui_list(sn:bpy.types.Scene, move_type:str='UP'):
         return
     
 
-    # scene_collection doesn't have 'move()' method which exists in collection property. so you have to manually re construct collection.
-    for c in scene_collection_children:
-        sn.collection.children.unlink(c)
-
     active_col = scene_collection_children.pop(move_from)
     scene_collection_children.insert(move_to, active_col)
-
-    for c in scene_collection_children:
-        sn.collection.children.link(c)
+    reorder_scene_collection_children(sn, scene_collection_children)
 
     setattr(sn, ct.SCENE_COLLECTION_CHILD_INDEX, move_to)
     return
 
 
+def sort_scene_collection_children(sn:bpy.types.Scene, parts_first:bool=True, reverse:bool=False):
+    """Sort scene collection children by name. Active collection stays active.
+    Args:
+        parts_first: If True, part collections are placed before non-part collections.
+        reverse: Reverse name order within each group. Part/non-part grouping is kept.
+    """
+    scene_collection_children = list(sn.collection.children)
+    if len(scene_collection_children) == 0:
+        return 1
+    active_col = get_ui_list_active_collection_from_index(sn, getattr(sn, ct.SCENE_COLLECTION_CHILD_INDEX))
+
+    new_order = sorted(scene_collection_children, key=lambda c: c.name.lower(), reverse=reverse)
+    if parts_first: # stable sort keeps name order within each group.
+        new_order.sort(key=lambda c: not getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION))
+    relinked_count = reorder_scene_collection_children(sn, new_order)
+
+    if active_col is not None and relinked_count > 0:
+        setattr(sn, ct.SCENE_COLLECTION_CHILD_INDEX, new_order.index(active_col))
+    return
+
+
+def reorder_scene_collection_children(sn:bpy.types.Scene, new_order:List[bpy.types.Collection])->int:
+    """Reorder scene collection children with minimum unlink/link.
+    Scene collection doesn't have 'move()' and link always appends. So the longest head of new order
+    which already keeps its relative order stays, and only the rest is relinked at the end.
+
+    Returns:
+        Number of relinked collections.
+    """
+    children = sn.collection.children
+    current_order = list(children)
+
+    keep_count = 0
+    current_i = 0
+    for c in new_order:
+        while current_i < len(current_order) and current_order[current_i] != c:
+            current_i += 1
+        if current_i == len(current_order):
+            break
+        keep_count += 1
+        current_i += 1
+
+    relink_cols = new_order[keep_count:]
+    for c in relink_cols:
+        children.unlink(c)
+    for c in relink_cols:
+        children.link(c)
+
+    if len(relink_cols) > 0:
+        invalidate_hierarchy_caches()
+    return len(relink_cols)
+
+
 def set_collection_visibility_property_under_part(part_collection:bpy.types.Collection, child_collection:bpy.types.Collection, extend:bool=False):
     """Set Collection Visibility Property Under Part.
     This stores the state of collection visibility under part. When using 'hide collection' operator, resets the visibility.
@@ -1106,14 +2637,226 @@ def part_children_visibility_toggle(part_collection:bpy.types.Collection, child_
     return
 
 
+#-------------------------------------------------------------------------------
+# Part Proxy
+#-------------------------------------------------------------------------------
+def get_part_proxy_name(part_name:str)->str:
+    """'F-xxx' -> 'PROXY-F-xxx'"""
+    return f"{ct.PART_PROXY_PREFIX}-{part_name}"
+
+
+def is_part_proxy_name(name:str)->bool:
+    return name.startswith(f"{ct.PART_PROXY_PREFIX}-")
+
+
+def get_part_name_of_proxy(name:str)->str:
+    """'PROXY-F-xxx' -> 'F-xxx'. Name which is not proxy is returned as it is."""
+    if is_part_proxy_name(name):
+        return name[len(ct.PART_PROXY_PREFIX) + 1:]
+    return name
+
+
+def gather_part_world_vertices(part_collection:bpy.types.Collection, depsgraph:bpy.types.Depsgraph, max_points_per_object:int=256)->np.ndarray:
+    """World space vertices of evaluated mesh objects in collection. Vertices are strided down to max_points_per_object."""
+    coords = []
+    for obj in part_collection.all_objects:
+        if obj.type != 'MESH':
+            continue
+        eval_obj = obj.evaluated_get(depsgraph)
+        mesh = eval_obj.to_mesh()
+        try:
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get('co', co)
+        finally:
+            eval_obj.to_mesh_clear()
+
+        co = co.reshape(-1, 3)
+        co = co[::max(1, len(co) // max(max_points_per_object, 1))]
+        mat = np.array(obj.matrix_world, dtype=np.float32)
+        coords.append(co @ mat[:3, :3].T + mat[:3, 3])
+
+    if len(coords) == 0:
+        return np.empty((0, 3), dtype=np.float32)
+    return np.concatenate(coords)
+
+
+def gather_part_world_bound_corners(part_collection:bpy.types.Collection)->np.ndarray:
+    """World space bounding box corners of mesh objects in collection. No evaluation needed."""
+    coords = []
+    for obj in part_collection.all_objects:
+        if obj.type != 'MESH':
+            continue
+        corners = np.array([c[:] for c in obj.bound_box], dtype=np.float32)
+        mat = np.array(obj.matrix_world, dtype=np.float32)
+        coords.append(corners @ mat[:3, :3].T + mat[:3, 3])
+
+    if len(coords) == 0:
+        return np.empty((0, 3), dtype=np.float32)
+    return np.concatenate(coords)
+
+
+def build_part_proxy_bmesh(part_collection:bpy.types.Collection, proxy_type:str, depsgraph:bpy.types.Depsgraph, max_points_per_object:int=256)->bmesh.types.BMesh:
+    """Build proxy geometry of part in world space.
+    Args:
+        proxy_type: 'BOUNDS' for bounding box, 'HULL' for convex hull of decimated vertices.
+    Returns:
+        BMesh, or None if part has no mesh.
+    """
+    if proxy_type == 'BOUNDS':
+        coords = gather_part_world_bound_corners(part_collection)
+    else:
+        coords = gather_part_world_vertices(part_collection, depsgraph, max_points_per_object)
+    if len(coords) == 0:
+        return None
+
+    bm = bmesh.new()
+    if proxy_type == 'BOUNDS':
+        min_co, max_co = coords.min(axis=0), coords.max(axis=0)
+        center, extent = (min_co + max_co) / 2, (max_co - min_co)
+        bmesh.ops.create_cube(bm, size=1.0)
+        for v in bm.verts:
+            v.co = [center[i] + v.co[i] * extent[i] for i in range(3)]
+    else:
+        for co in coords:
+            bm.verts.new(co)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts[:])
+        bmesh.ops.delete(bm, geom=[v for v in result['geom_interior'] + result['geom_unused'] if isinstance(v, bmesh.types.BMVert)], context='VERTS')
+    return bm
+
+
+def generate_part_proxy(part_collection:bpy.types.Collection, proxy_type:str, depsgraph:bpy.types.Depsgraph, max_points_per_object:int=256):
+    """Create or update 'PROXY-' collection of part in current file.
+    Proxy collection is not linked to scene but kept by fake user, so other files can link it instead of the part.
+    """
+    bm = build_part_proxy_bmesh(part_collection, proxy_type, depsgraph, max_points_per_object)
+    if bm is None:
+        print(f"No mesh found in '{part_collection.name}'. Proxy not generated.")
+        return 1
+
+    proxy_name = get_part_proxy_name(part_collection.name)
+    proxy_obj = bpy.data.objects.get(proxy_name)
+    if proxy_obj is None or proxy_obj.library is not None or proxy_obj.type != 'MESH':
+        proxy_obj = bpy.data.objects.new(name=proxy_name, object_data=bpy.data.meshes.new(proxy_name))
+    bm.to_mesh(proxy_obj.data)
+    bm.free()
+    proxy_obj.display_type = 'WIRE' if proxy_type == 'BOUNDS' else 'SOLID'
+
+    proxy_col = bpy.data.collections.get(proxy_name)
+    if proxy_col is None or proxy_col.library is not None:
+        proxy_col = bpy.data.collections.new(proxy_name)
+    proxy_col.use_fake_user = True
+    proxy_col.instance_offset = part_collection.instance_offset
+    if proxy_obj.name not in proxy_col.objects:
+        proxy_col.objects.link(proxy_obj)
+    return
+
+
+def generate_part_proxies(part_collections:List[bpy.types.Collection], proxy_type:str, max_points_per_object:int=256)->int:
+    """Generate proxies for local parts. Returns number of generated proxies."""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    generated_count = 0
+    for part_col in part_collections:
+        if part_col.library is not None or is_part_proxy_name(part_col.name):
+            continue
+        if generate_part_proxy(part_col, proxy_type, depsgraph, max_points_per_object) == 1:
+            continue
+        generated_count += 1
+    return generated_count
+
+
+#-------------------------------------------------------------------------------
+# Part Visibility Preset
+#-------------------------------------------------------------------------------
+def prefixes_to_visibility_mask(prefixes:List[str])->int:
+    """Convert reserved collection prefixes to bitmask. Bit order follows PartManager.reserved_collection_prefix."""
+    mask = 0
+    for i, prefix in enumerate(PartManager.reserved_collection_prefix):
+        if prefix in prefixes:
+            mask |= 1 << i
+    return mask
+
+
+def get_part_visibility_mask(part_collection:bpy.types.Collection)->int:
+    """Current visibility property of reserved collections under part as bitmask."""
+    visibilities = PartManager.get_collection_visibility_dict(part_collection)
+    return prefixes_to_visibility_mask([prefix for prefix, visible in visibilities.items() if visible])
+
+
+def find_part_visibility_preset_mask(part_collection:bpy.types.Collection, preset_name:str)->int:
+    """Find preset stored in part, then builtin preset. Returns None if not found."""
+    preset = getattr(part_collection, ct.PART_VISIBILITY_PRESETS).get(preset_name)
+    if preset is not None:
+        return preset.mask
+
+    builtin_prefixes = ct.BUILTIN_PART_VISIBILITY_PRESETS.get(preset_name)
+    if builtin_prefixes is not None:
+        return prefixes_to_visibility_mask(builtin_prefixes)
+    return None
+
+
+def save_part_visibility_preset(part_collection:bpy.types.Collection, preset_name:str, mask:int):
+    """Add or overwrite preset stored in part."""
+    presets = getattr(part_collection, ct.PART_VISIBILITY_PRESETS)
+    preset = presets.get(preset_name)
+    if preset is None:
+        preset = presets.add()
+        preset.name = preset_name
+    preset.mask = mask
+    return
+
+
+def apply_part_visibility_preset(part_collections:List[bpy.types.Collection], preset_name:str, view_layer:bpy.types.ViewLayer, fallback_mask:int=None)->int:
+    """Apply visibility preset to given parts in a single pass.
+    Visibility properties are written only when changed, then active part is isolated once.
+
+    Args:
+        fallback_mask: used for part which doesn't have preset with given name. If None, the part is skipped.
+
+    Returns:
+        Number of parts which preset was applied to.
+    """
+    applied_count = 0
+    for part_col in part_collections:
+        mask = find_part_visibility_preset_mask(part_col, preset_name)
+        if mask is None:
+            mask = fallback_mask
+        if mask is None:
+            continue
+
+        part_child_collection_dict = PartManager.get_collection_dict(part_col)
+        for i, prefix in enumerate(PartManager.reserved_collection_prefix):
+            col = part_child_collection_dict.get(prefix)
+            if col is None or col.library is not None:
+                continue
+            visible = bool(mask & (1 << i))
+            if getattr(col, ct.TEMP_VISIBILITY) != visible:
+                setattr(col, ct.TEMP_VISIBILITY, visible)
+        applied_count += 1
+
+    active_col = getattr(view_layer.id_data, ct.ACTIVE_UILIST_COLLECTION)
+    if active_col is not None and active_col in part_collections:
+        isolate_scene_child_collection(view_layer, active_col)
+    return applied_count
+
+
+_part_visibility_preset_enum_items = [] # Blender needs python to keep reference to dynamic enum strings.
+
+def part_visibility_preset_items_callback(self, context):
+    """Builtin presets and presets stored in active part."""
+    names = list(ct.BUILTIN_PART_VISIBILITY_PRESETS.keys())
+    part_col = getattr(context.scene, ct.ACTIVE_PART_COLLECTION)
+    if part_col is not None:
+        names += [p.name for p in getattr(part_col, ct.PART_VISIBILITY_PRESETS) if p.name not in names]
+
+    _part_visibility_preset_enum_items[:] = [(name, name, "") for name in names]
+    return _part_visibility_preset_enum_items
+
+
 def isolate_collection_under_scene(collection:bpy.types.Collection, extend:bool=False):
     """Isolate collection visibility under current scene.
     """
-    # scene_col = bpy.context.scene.collection
-    try:
-        # index = scene_col.children_recursive.index(collection)
-        index = get_index_for_hide_collection_ops(bpy.context.scene, collection)
-    except ValueError:
+    index = get_index_for_hide_collection_ops(bpy.context.scene, collection)
+    if index is None:
         print("Given collection is not children of this scene collection (recursively checked).")
         return
 
@@ -1126,51 +2869,9 @@ def get_index_for_hide_collection_ops(scene:bpy.types.Scene, target_collection:b
     """Return index of collection for bpy.ops.object.hide_collection.
     Return Index is already added one for used in oeprator.
     """
-    scene_col = scene.collection
-    index, found = _find_index_of_collection_in_scene(collection_list=list(scene_col.children), target_col=target_collection, index=0)
-    if found:
-        return index
-    else:
-        return None
+    return CollectionTreeIndex.get_operator_index(scene, target_collection)
 
 
-# def _find_index_of_collection_in_scene(collection_list:List[bpy.types.Collection], target_col:bpy.types.Collection, index:int):
-#     """Recursively search index of given collection in collection list. Count is done according to the bpy.ops.hide_collection collection_index.
-#     """
-#     if collection_list == []: # if collection is empty, then no more collections to search. Not found.
-#         return None
-    
-#     next_collection_list = []
-#     for c in collection_list:
-#         index += 1
-#         if c == target_col:
-#             return index
-#         next_collection_list += list(c.children)
-
-#     else:
-#         index = _find_index_of_collection_in_scene(next_collection_list, target_col, index)
-#         return index
-            
-def _find_index_of_collection_in_scene(collection_list:List[bpy.types.Collection], target_col:bpy.types.Collection, index:int):
-    """Recursively search index of given collection in collection list. 
-    Count is the format of bpy.ops.hide_collection collection_index. I.e. first collection index is 1.
-    """
-    if collection_list == []:
-        return index, False
-    
-    for c in collection_list:
-        index+=1
-        if c == target_col:
-            return index, True
-
-    for c in collection_list:
-        index, found = _find_index_of_collection_in_scene(collection_list=list(c.children), target_col=target_col, index=index)
-        if found:
-            return index, True
-        
-    return index, False
-    
-            
 def get_view_3d_context()->bpy.types.Context:
     """Get view 3d context for context.temp_override.
     With this, you can get View 3D context to run bpy.ops.object.foo()
@@ -1229,16 +2930,47 @@ def fix_part_render_and_viewport_visibilities():
     This function fixes hide_render and hide_viewport property on collections
     under every part collections.
     """
-    # parts_collections = [c for c in bpy.data.collections if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION)]
-    # parts_collections = [c for c in bpy.data.collections if getattr(c, ct.IS_MD_HARDSURF_PART_COLLECTION)]
     part_col = getattr(bpy.context.scene, ct.ACTIVE_PART_COLLECTION)
+    if part_col is None:
+        print("No active part collection.")
+        return 1
     PartManager.fix_part_visibility(part_col)
-    
-    # for part_col in parts_collections:
-    #     PartManager.fix_part_visibility(part_col)
-
     return
 
+
+def fix_all_parts_render_and_viewport_visibilities()->int:
+    """Fix visibilities of every local part collection in file.
+    Targets are gathered once and deduplicated, and only properties with different value are written.
+
+    Returns:
+        Number of written properties.
+    """
+    target_ids = {}
+    for part_col in PartIndex.get_part_collections():
+        if part_col.library is None:
+            PartManager.gather_fix_visibility_targets(part_col, target_ids)
+
+    changed_count = set_hide_state_if_changed(target_ids.values(), render=False, viewport=False)
+    print(f"Fixed visibilities: {changed_count} properties changed in {len(target_ids)} collections and objects.")
+    return changed_count
+
+
+def set_hide_state_if_changed(ids, render:bool=None, viewport:bool=None)->int:
+    """Set hide_render and hide_viewport of collections and objects only when value differs.
+    Returns number of written properties.
+    """
+    changed_count = 0
+    for id_data in ids:
+        if id_data.library is not None: # linked data is not editable.
+            continue
+        if render is not None and id_data.hide_render != render:
+            id_data.hide_render = render
+            changed_count += 1
+        if viewport is not None and id_data.hide_viewport != viewport:
+            id_data.hide_viewport = viewport
+            changed_count += 1
+    return changed_count
+
 #-------------------------------------------------------------------------------
 # Rename Move File and Data and Sync Project
 #-------------------------------------------------------------------------------